@@ -4,8 +4,9 @@ Valid for f > 0; numerically stable through ~40 kHz.
 
 Provides:
   - a_weight_db(f): A-weighting correction in dB at frequency f (adds to SPL)
-  - a_weight_db_many(freqs): convenience vector form
+  - a_weight_db_many(freqs): vectorized form (NumPy), returns an ndarray
   - a_weight_table(centers): mapping center -> A(dB)
+  - A_WEIGHT_AT_NOMINAL: precomputed A(dB) at ISO nominal 1/3-octave centers
   - overall_level_dba(band_levels_db, band_centers_hz): overall dB(A) from bands
 
 References:
@@ -16,13 +17,19 @@ from __future__ import annotations
 
 import math
 from functools import lru_cache
-from typing import Dict, List, Sequence
+from typing import Any, Callable, Dict, Sequence, Tuple, Union
+
+import numpy as np
 
 __all__ = [
     "a_weight_db",
     "a_weight_db_many",
     "a_weight_table",
     "overall_level_dba",
+    "a_weight_vector",
+    "a_weighted_level_sum",
+    "ISO_THIRD_OCTAVE_CENTERS",
+    "A_WEIGHT_AT_NOMINAL",
 ]
 
 # ---- Precise IEC 61672 break frequencies (Hz) ----
@@ -38,24 +45,32 @@ _F3_2 = _F3 * _F3
 _F4_2 = _F4 * _F4
 
 
-def _ra_unscaled(f_hz: float) -> float:
+def _ra_unscaled(
+    f_hz: Union[float, np.ndarray],
+    sqrt: Callable[[Any], Any] = math.sqrt,
+) -> Union[float, np.ndarray]:
     """
     IEC 61672 magnitude response (not in dB, not normalized), R_A(f).
 
     R_A(f) = ((f^2 + f4^2) * f^4) /
              ((f^2 + f1^2) * sqrt((f^2 + f2^2)(f^2 + f3^2)) * f4^2)
+
+    Single implementation for both forms: pass sqrt=np.sqrt for ndarray input.
     """
     f2 = f_hz * f_hz
     num = (f2 + _F4_2) * (f2 * f2)
-    den = (f2 + _F1_2) * math.sqrt((f2 + _F2_2) * (f2 + _F3_2)) * _F4_2
+    den = (f2 + _F1_2) * sqrt((f2 + _F2_2) * (f2 + _F3_2)) * _F4_2
     return num / den
 
 
 # Normalize exactly to 0.00 dB at 1 kHz (precompute once)
 _RA_1K = _ra_unscaled(1000.0)
 
+# dB <-> linear energy via exp/log (cheaper than pow/log10): 10^(x/10) = e^(x*ln10/10)
+_LN10_OVER_10 = math.log(10.0) / 10.0
+_10_OVER_LN10 = 10.0 / math.log(10.0)
+
 
-@lru_cache(maxsize=4096)
 def a_weight_db(f_hz: float) -> float:
     """
     A-weighting correction (dB) at frequency f_hz (Hz), to ADD to an SPL at f.
@@ -72,9 +87,58 @@ def a_weight_db(f_hz: float) -> float:
     return 20.0 * math.log10(ra)
 
 
-def a_weight_db_many(freqs_hz: Sequence[float]) -> List[float]:
-    """Vector-friendly wrapper around a_weight_db."""
-    return [a_weight_db(float(f)) for f in freqs_hz]
+def a_weight_db_many(freqs_hz: Sequence[float] | np.ndarray) -> np.ndarray:
+    """
+    Vectorized A-weighting correction (dB) for an array of frequencies (Hz).
+
+    Same IEC 61672 expression as a_weight_db, evaluated in one NumPy pass
+    (useful for 1/3-octave center lists and full FFT bin grids alike).
+
+    Raises
+    ------
+    ValueError : if any frequency is <= 0.
+    """
+    f = np.asarray(freqs_hz, dtype=np.float64)
+    if f.size and not np.all(f > 0.0):
+        raise ValueError("Frequency must be > 0 Hz (DC is undefined for A-weighting).")
+    return 20.0 * np.log10(_ra_unscaled(f, np.sqrt) / _RA_1K)
+
+
+# ---- Precomputed corrections at ISO nominal 1/3-octave centers (10 Hz … 40 kHz) ----
+ISO_THIRD_OCTAVE_CENTERS: tuple[float, ...] = (
+    10.0, 12.5, 16.0, 20.0, 25.0, 31.5, 40.0, 50.0, 63.0, 80.0,
+    100.0, 125.0, 160.0, 200.0, 250.0, 315.0, 400.0, 500.0, 630.0, 800.0,
+    1000.0, 1250.0, 1600.0, 2000.0, 2500.0, 3150.0, 4000.0, 5000.0, 6300.0, 8000.0,
+    10_000.0, 12_500.0, 16_000.0, 20_000.0, 25_000.0, 31_500.0, 40_000.0,
+)
+
+_A_AT_NOMINAL_ARRAY = a_weight_db_many(ISO_THIRD_OCTAVE_CENTERS)
+_A_AT_NOMINAL_ARRAY.setflags(write=False)
+A_WEIGHT_AT_NOMINAL: Dict[float, float] = dict(
+    zip(ISO_THIRD_OCTAVE_CENTERS, _A_AT_NOMINAL_ARRAY.tolist())
+)
+
+
+def _a_weights_for(centers_hz: Sequence[float] | np.ndarray) -> np.ndarray:
+    """A(dB) per center: table lookup for nominal centers, vector compute otherwise."""
+    if centers_hz is ISO_THIRD_OCTAVE_CENTERS:
+        return _A_AT_NOMINAL_ARRAY
+    try:
+        return np.fromiter(
+            (A_WEIGHT_AT_NOMINAL[float(c)] for c in centers_hz),
+            dtype=np.float64,
+            count=len(centers_hz),
+        )
+    except KeyError:
+        return a_weight_db_many(centers_hz)
+
+
+@lru_cache(maxsize=8)
+def _a_weights_cached(centers_hz: Tuple[float, ...]) -> np.ndarray:
+    """A(dB) per center, cached per center grid (read-only)."""
+    a = np.array(_a_weights_for(centers_hz), dtype=np.float64)
+    a.setflags(write=False)
+    return a
 
 
 def a_weight_table(
@@ -91,11 +155,36 @@ def a_weight_table(
     rounding : int | None
         If not None, round the dB corrections to this many decimals.
     """
-    tbl: Dict[float, float] = {}
-    for c in centers_hz:
-        val = a_weight_db(float(c))
-        tbl[float(c)] = round(val, rounding) if rounding is not None else val
-    return tbl
+    keys = [float(c) for c in centers_hz]
+    vals = _a_weights_for(keys).tolist()
+    if rounding is not None:
+        vals = [round(v, rounding) for v in vals]
+    return dict(zip(keys, vals))
+
+
+def a_weight_vector(band_centers_hz: Sequence[float]) -> np.ndarray:
+    """
+    A(dB) per band center as a read-only array, cached per center grid. Callers
+    with a fixed grid can resolve it once and use a_weighted_level_sum per frame.
+    """
+    return _a_weights_cached(tuple(np.asarray(band_centers_hz, dtype=np.float64).tolist()))
+
+
+def a_weighted_level_sum(band_levels_db: Sequence[float], a_weights_db: np.ndarray) -> float:
+    """
+    overall_level_dba with the weighting already resolved (see a_weight_vector):
+    the log-sum-exp energy sum of band_levels_db + a_weights_db, in dB(A).
+    """
+    La = np.asarray(band_levels_db, dtype=np.float64) + a_weights_db
+    if La.size == 0:
+        return float("-inf")
+
+    # Log-sum-exp: factor out the loudest band so no term over/underflows
+    m = float(La.max())
+    if math.isinf(m):
+        return m  # all bands silent (-inf), or an infinite band (+inf)
+    total = float(np.exp((La - m) * _LN10_OVER_10).sum())
+    return m + _10_OVER_LN10 * math.log(total)
 
 
 def overall_level_dba(
@@ -108,6 +197,9 @@ def overall_level_dba(
 
         L_Aeq = 10*log10( sum_i 10^{(L_i + A(f_i))/10} )
 
+    evaluated as log-sum-exp around the loudest band, so wide dB swings
+    neither overflow nor underflow.
+
     Raises
     ------
     ValueError : if lengths mismatch.
@@ -115,12 +207,8 @@ def overall_level_dba(
     if len(band_levels_db) != len(band_centers_hz):
         raise ValueError("band_levels_db and band_centers_hz must have same length")
 
-    total_lin = 0.0
-    for L, fc in zip(band_levels_db, band_centers_hz):
-        La = L + a_weight_db(float(fc))
-        total_lin += 10.0 ** (La / 10.0)
-
-    return float("-inf") if total_lin <= 0.0 else 10.0 * math.log10(total_lin)
+    # The band grid is fixed across minutes/frames, so the weighting is cached
+    return a_weighted_level_sum(band_levels_db, a_weight_vector(band_centers_hz))
 
 
 if __name__ == "__main__":
@@ -6,24 +6,29 @@ Provides:
   - third_octave_centers_extended(): convenience for 10 Hz … 40 kHz
   - third_octave_band_edges(fc): (flo, fhi) using ±1/6 octave ratio
   - nominal_center_label(fc): canonical labels (10, 12.5, 16, …, 31.5k, 40k)
+  - nominal_center_label_from_k(k): same label, looked up by band index k
   - nominal_centers(...), nominal_centers_extended(): labeled sequences
   - find_band_for_frequency(f): locate containing 1/3-oct band
   - bin_narrowband_levels_to_third_octave(freqs, levels): energy-sum binner
 
-No external dependencies (NumPy optional elsewhere).
+Binning is vectorized with NumPy (searchsorted over band edges).
 """
 
 from __future__ import annotations
 
 import math
+from bisect import bisect_left
 from functools import lru_cache
 from typing import Dict, List, Sequence, Tuple
 
+import numpy as np
+
 __all__ = [
     "third_octave_centers",
     "third_octave_centers_extended",
     "third_octave_band_edges",
     "nominal_center_label",
+    "nominal_center_label_from_k",
     "nominal_centers",
     "nominal_centers_extended",
     "find_band_for_frequency",
@@ -35,9 +40,13 @@ _OCT_THIRD = 2.0 ** (1.0 / 3.0)   # center-to-center ratio
 _HALF_THIRD = 2.0 ** (1.0 / 6.0)  # edge factor around the center (±1/6 octave)
 
 _DEFAULT_FREF = 1000.0
+_LN10_OVER_10 = math.log(10.0) / 10.0
+_3_OVER_LN2 = 3.0 / math.log(2.0)  # 3*log2(x) == log(x) * _3_OVER_LN2
 
 # Preferred nominal multipliers within a decade (IEC-friendly labeling)
 _NOMINAL_DECADE = [1.00, 1.25, 1.60, 2.00, 2.50, 3.15, 4.00, 5.00, 6.30, 8.00]
+# Snap thresholds: m <= _NOMINAL_MIDPOINTS[i] snaps to _NOMINAL_DECADE[i] (ties go low)
+_NOMINAL_MIDPOINTS = tuple((a + b) / 2.0 for a, b in zip(_NOMINAL_DECADE, _NOMINAL_DECADE[1:]))
 
 
 # -------- Core IEC math --------
@@ -66,8 +75,14 @@ def third_octave_centers(
     fref_hz: float = _DEFAULT_FREF,
 ) -> List[float]:
     """Exact geometric third-octave centers within [fmin_hz, fmax_hz]."""
+    return list(_third_octave_centers_tuple(float(fmin_hz), float(fmax_hz), float(fref_hz)))
+
+
+@lru_cache(maxsize=32)
+def _third_octave_centers_tuple(fmin_hz: float, fmax_hz: float, fref_hz: float) -> Tuple[float, ...]:
+    """Cached (immutable) core of third_octave_centers."""
     k_min, k_max = index_range_for_limits(fmin_hz, fmax_hz, fref_hz)
-    return [center_from_index(k, fref_hz) for k in range(k_min, k_max + 1)]
+    return tuple(center_from_index(k, fref_hz) for k in range(k_min, k_max + 1))
 
 
 def third_octave_centers_extended(
@@ -79,6 +94,7 @@ def third_octave_centers_extended(
     return third_octave_centers(fmin_hz=fmin_hz, fmax_hz=fmax_hz, fref_hz=fref_hz)
 
 
+@lru_cache(maxsize=4096)
 def third_octave_band_edges(fc_hz: float) -> Tuple[float, float]:
     """Lower/upper edges: f_lo = f_c / 2^(1/6),  f_hi = f_c * 2^(1/6)."""
     return (fc_hz / _HALF_THIRD, fc_hz * _HALF_THIRD)
@@ -86,7 +102,6 @@ def third_octave_band_edges(fc_hz: float) -> Tuple[float, float]:
 
 # -------- Nominal labeling (IEC-style display) --------
 
-@lru_cache(maxsize=4096)
 def nominal_center_label(fc_hz: float) -> float:
     """
     Map an exact geometric center to the canonical nominal label used in plots & tables.
@@ -107,7 +122,7 @@ def nominal_center_label(fc_hz: float) -> float:
     p = math.floor(math.log10(fc_hz))
     m = fc_hz / (10.0 ** p)
 
-    best = min(_NOMINAL_DECADE, key=lambda x: abs(x - m))
+    best = _NOMINAL_DECADE[bisect_left(_NOMINAL_MIDPOINTS, m)]
     val = best * (10.0 ** p)
 
     # Keep a single decimal only when it matters (e.g., 12.5, 31.5)
@@ -115,13 +130,29 @@ def nominal_center_label(fc_hz: float) -> float:
     return val_1 if abs(val_1 - round(val_1)) > 1e-9 else round(val_1)
 
 
+# Labels for the default reference, by band index (k = -30 … 50 covers ≈1 Hz … 100 kHz)
+_LABEL_BY_K: Dict[int, float] = {
+    k: nominal_center_label(center_from_index(k)) for k in range(-30, 51)
+}
+
+
+def nominal_center_label_from_k(k: int, fref_hz: float = _DEFAULT_FREF) -> float:
+    """nominal_center_label(center_from_index(k, fref_hz)), table-driven for the default fref."""
+    if fref_hz == _DEFAULT_FREF:
+        label = _LABEL_BY_K.get(k)
+        if label is not None:
+            return label
+    return nominal_center_label(center_from_index(k, fref_hz))
+
+
 def nominal_centers(
     fmin_hz: float = 20.0,
     fmax_hz: float = 20_000.0,
     fref_hz: float = _DEFAULT_FREF,
 ) -> List[float]:
     """Canonical nominal labels for centers within the limits."""
-    return [nominal_center_label(fc) for fc in third_octave_centers(fmin_hz, fmax_hz, fref_hz)]
+    k_min, k_max = index_range_for_limits(fmin_hz, fmax_hz, fref_hz)
+    return [nominal_center_label_from_k(k, fref_hz) for k in range(k_min, k_max + 1)]
 
 
 def nominal_centers_extended(
@@ -130,7 +161,7 @@ def nominal_centers_extended(
     fref_hz: float = _DEFAULT_FREF,
 ) -> List[float]:
     """Nominal labels across the extended range (10, 12.5, 16, …, 31.5k, 40k)."""
-    return [nominal_center_label(fc) for fc in third_octave_centers_extended(fmin_hz, fmax_hz, fref_hz)]
+    return nominal_centers(fmin_hz, fmax_hz, fref_hz)
 
 
 # -------- Find / bin helpers --------
@@ -146,7 +177,8 @@ def find_band_for_frequency(
     if f_hz <= 0:
         raise ValueError("f_hz must be > 0")
 
-    k = int(round(3.0 * math.log2(f_hz / fref_hz)))
+    # Nearest index; any rounding drift here is corrected by the edge checks below
+    k = int(round(math.log(f_hz / fref_hz) * _3_OVER_LN2))
     fc = center_from_index(k, fref_hz)
     flo, fhi = third_octave_band_edges(fc)
 
@@ -181,36 +213,48 @@ def bin_narrowband_levels_to_third_octave(
     if len(freqs_hz) != len(levels_db):
         raise ValueError("freqs_hz and levels_db must have the same length")
 
+    lo, hi, label_idx, labels = _band_layout(float(fmin_hz), float(fmax_hz), float(fref_hz))
+
+    f = np.asarray(freqs_hz, dtype=np.float64)
+    L = np.asarray(levels_db, dtype=np.float64)
+
+    # Band k holds lo[k] < f <= hi[k]: first upper edge >= f, then check the lower edge
+    k = np.searchsorted(hi, f, side="left")
+    inside = (f > 0.0) & (k < len(hi))
+    inside[inside] &= f[inside] > lo[k[inside]]
+
+    # Single pass: energies go straight to their (possibly shared) nominal label
+    sums_lin = np.bincount(
+        label_idx[k[inside]], weights=np.exp(L[inside] * _LN10_OVER_10), minlength=len(labels)
+    )
+    return {
+        lbl: float("-inf") if s <= 0.0 else 10.0 * math.log10(s)
+        for lbl, s in zip(labels, sums_lin.tolist())
+    }
+
+
+@lru_cache(maxsize=32)
+def _band_layout(
+    fmin_hz: float, fmax_hz: float, fref_hz: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Tuple[float, ...]]:
+    """
+    Per-range band layout for the binner: lower/upper edge arrays, the output-label
+    index of every band, and the distinct nominal labels (in band order).
+    """
     centers = third_octave_centers(fmin_hz, fmax_hz, fref_hz)
     edges = [third_octave_band_edges(fc) for fc in centers]
-    labels = [nominal_center_label(fc) for fc in centers]
-
-    sums_lin: Dict[float, float] = {label: 0.0 for label in labels}
-
-    for f, L in zip(freqs_hz, levels_db):
-        if f <= 0:
-            continue
-        if f < edges[0][0] or f > edges[-1][1]:
-            continue
-
-        # Estimate an index near the correct band
-        k_est = int(round(3.0 * math.log2(f / fref_hz) - 3.0 * math.log2(centers[0] / fref_hz)))
-        k = min(max(k_est, 0), len(centers) - 1)
-
-        # Walk to the containing band if the estimate is off
-        while k > 0 and f < edges[k][0]:
-            k -= 1
-        while k < len(centers) - 1 and f > edges[k][1]:
-            k += 1
-
-        if edges[k][0] < f <= edges[k][1]:
-            sums_lin[labels[k]] += 10.0 ** (L / 10.0)
-
-    # Convert back to dB
-    out: Dict[float, float] = {}
-    for lbl, s in sums_lin.items():
-        out[lbl] = float("-inf") if s <= 0.0 else 10.0 * math.log10(s)
-    return out
+    lo = np.array([e[0] for e in edges], dtype=np.float64)
+    hi = np.array([e[1] for e in edges], dtype=np.float64)
+
+    band_labels = nominal_centers(fmin_hz, fmax_hz, fref_hz)
+    labels: Dict[float, int] = {}
+    for lbl in band_labels:
+        labels.setdefault(lbl, len(labels))
+    label_idx = np.array([labels[lbl] for lbl in band_labels], dtype=np.intp)
+
+    for arr in (lo, hi, label_idx):
+        arr.setflags(write=False)
+    return lo, hi, label_idx, tuple(labels)
 
 
 if __name__ == "__main__":
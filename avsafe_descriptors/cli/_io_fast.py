@@ -0,0 +1,132 @@
+# avsafe_descriptors/cli/_io_fast.py
+"""
+JSONL I/O and flag-shape helpers for the rules CLI.
+
+Kept in their own fully annotated module so they can be compiled with mypyc
+(``make mypyc``, i.e. ``mypyc avsafe_descriptors/cli/_io_fast.py``). The
+compiled extension, when present next to this file, takes import precedence;
+otherwise this pure-Python module is used unchanged.
+"""
+from __future__ import annotations
+
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+
+from avsafe_descriptors.io.jsonl_io import dumps_line, loads_line
+
+__all__ = ["read_jsonl", "write_jsonl", "flags_from_results"]
+
+
+# Files above this size are parsed in parallel, one process per line-aligned shard
+_PARALLEL_READ_MIN_BYTES = 64 * 1024 * 1024
+_READ_BUFFER = 1 << 20
+
+
+def _parse_lines(lines: Iterable[bytes]) -> List[Dict[str, Any]]:
+    out: List[Dict[str, Any]] = []
+    for line in lines:
+        # Skip blanks without a strip() copy; loads_line accepts the raw bytes
+        if not line or line.isspace():
+            continue
+        out.append(loads_line(line))
+    return out
+
+
+def _parse_shard(path: str, start: int, end: int) -> List[Dict[str, Any]]:
+    """Parse the JSONL records in bytes [start, end) of `path` (line-aligned)."""
+    with open(path, "rb") as f:
+        f.seek(start)
+        return _parse_lines(f.read(end - start).splitlines())
+
+
+def _shard_bounds(path: Path, size: int, n: int) -> List[Tuple[int, int]]:
+    """Split [0, size) into up to n ranges that each end just after a newline."""
+    bounds: List[Tuple[int, int]] = []
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = 0
+        for k in range(1, n):
+            nl = mm.find(b"\n", max(start, size * k // n))
+            if nl < 0:
+                break
+            bounds.append((start, nl + 1))
+            start = nl + 1
+        if start < size:
+            bounds.append((start, size))
+    return bounds
+
+
+def read_jsonl(path: Path) -> List[Dict[str, Any]]:
+    """
+    JSONL reader (orjson-backed when installed). Large files are split into
+    line-aligned shards parsed in a process pool; record order is preserved.
+    """
+    size = path.stat().st_size
+    workers = os.cpu_count() or 1
+    if size > _PARALLEL_READ_MIN_BYTES and workers > 1:
+        bounds = _shard_bounds(path, size, workers)
+        if len(bounds) > 1:
+            starts, ends = zip(*bounds)
+            out: List[Dict[str, Any]] = []
+            with ProcessPoolExecutor(max_workers=len(bounds)) as ex:
+                for part in ex.map(_parse_shard, [str(path)] * len(bounds), starts, ends):
+                    out.extend(part)
+            return out
+    with path.open("rb", buffering=_READ_BUFFER) as f:
+        return _parse_lines(f)
+
+
+_WRITE_GROUP = 65_536
+
+
+def write_jsonl(path: Path, rows: Iterable[Dict[str, Any]], indent: int) -> None:
+    """Write JSON Lines. If indent > 0, pretty-print each line."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    width = indent if indent and indent > 0 else 0
+    it = iter(rows)
+    with path.open("wb") as f:
+        # One joined buffer per _WRITE_GROUP rows instead of a write per row
+        while True:
+            chunk = [dumps_line(r, indent=width) for r in islice(it, _WRITE_GROUP)]
+            if not chunk:
+                break
+            f.write(b"\n".join(chunk) + b"\n")
+
+
+def flags_from_results(results: Any, minutes_len: int) -> List[Dict[str, Any]]:
+    """
+    Extract per-minute flags from an evaluate_minutes() result.
+    Be tolerant to schema differences (or a non-dict result); fall back to empty flags.
+    """
+    if not isinstance(results, dict):
+        return [{"idx": i, "flags": []} for i in range(minutes_len)]
+
+    # Common shapes we might see:
+    # - results.get("per_minute") -> list of {"idx":i,"flags":[...]}
+    # - results.get("flags_per_minute") -> same
+    # - results.get("minutes", [])[i].get("flags")
+    for key in ("per_minute", "flags_per_minute"):
+        v = results.get(key)
+        if isinstance(v, list) and all(isinstance(x, dict) for x in v):
+            # Ensure idx is present
+            rows: List[Dict[str, Any]] = []
+            for i, row in enumerate(v):
+                idx = int(row.get("idx", i))
+                flags = row.get("flags", [])
+                rows.append({"idx": idx, "flags": flags})
+            return rows
+
+    minutes = results.get("minutes")
+    if isinstance(minutes, list):
+        rows = []
+        for i, m in enumerate(minutes):
+            flags = m.get("flags", [])
+            rows.append({"idx": i, "flags": flags})
+        if rows:
+            return rows
+
+    # Fallback: empty flags for each minute
+    return [{"idx": i, "flags": []} for i in range(minutes_len)]
@@ -6,21 +6,29 @@ Enforce privacy defaults on minute JSONL:
 Usage:
   python -m avsafe_descriptors.cli.policy_enforce --in minutes.jsonl --out minutes_sanitized.jsonl
 """
-import argparse, json, sys
+import argparse, sys
+
+from avsafe_descriptors.io.jsonl_io import dumps_line, loads_line
+
+_WRITE_GROUP=65536  # records per joined write
 
 def run(inp, outp, retention=365, max_geohash=7):
-    n=0
+    """Stream JSONL bytes from `inp` to `outp` (binary files); returns records written."""
+    loads, dumps, mg = loads_line, dumps_line, max_geohash
+    n=0; buf=[]
     for line in inp:
-        line=line.strip()
-        if not line: continue
-        rec=json.loads(line)
-        rec.setdefault("retention_days", retention)
-        loc=rec.get("location") or {}
-        gh=loc.get("geohash")
-        if isinstance(gh,str) and len(gh)>max_geohash:
-            loc["geohash"]=gh[:max_geohash]
-            rec["location"]=loc
-        outp.write(json.dumps(rec, ensure_ascii=False)+"\n"); n+=1
+        if line.isspace(): continue  # stops at the first non-space byte, no copy
+        rec=loads(line)
+        if "retention_days" not in rec: rec["retention_days"]=retention
+        loc=rec.get("location")
+        if loc:
+            gh=loc.get("geohash")
+            if isinstance(gh,str) and len(gh)>mg: loc["geohash"]=gh[:mg]
+        buf.append(dumps(rec))
+        if len(buf)>=_WRITE_GROUP:
+            outp.write(b"\n".join(buf)+b"\n"); n+=len(buf); buf.clear()
+    if buf:
+        outp.write(b"\n".join(buf)+b"\n"); n+=len(buf)
     return n
 
 def main():
@@ -30,7 +38,7 @@ def main():
     ap.add_argument("--retention", type=int, default=365)
     ap.add_argument("--max-geohash", type=int, default=7)
     args=ap.parse_args()
-    with open(args.inp,"r",encoding="utf-8") as f, open(args.out,"w",encoding="utf-8") as g:
+    with open(args.inp,"rb",buffering=1<<20) as f, open(args.out,"wb") as g:
         n=run(f,g,args.retention,args.max_geohash)
     print(f"Sanitized {n} minutes → {args.out}")
 
@@ -14,8 +14,9 @@ Examples
 
 Notes
 -----
-This CLI calls `render()` from `report.render_html`. The current expected signature is:
+This CLI calls `render()` from `report.render_html` (or `render_to_string()` for --stdout):
     render(minutes_path, results_path, out_path)
+    render_to_string(minutes_path, results_path) -> str
 
 If that function grows optional features later (e.g., title, base_url), this CLI remains compatible.
 """
@@ -23,6 +24,8 @@ If that function grows optional features later (e.g., title, base_url), this CLI
 from __future__ import annotations
 
 import argparse
+import os
+import stat
 import sys
 import traceback
 from pathlib import Path
@@ -31,7 +34,7 @@ import webbrowser
 
 # Import the renderer (keep relative import as you had it)
 try:
-    from ..report.render_html import render  # type: ignore
+    from ..report.render_html import render, render_to_string, warmup  # type: ignore
 except Exception as e:  # pragma: no cover
     print("FATAL: cannot import report renderer '..report.render_html.render'.", file=sys.stderr)
     raise
@@ -94,18 +97,25 @@ def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
 
 
 def ensure_readable(path: Path, what: str) -> None:
-    if not path.exists():
-        raise FileNotFoundError(f"{what} not found: {path}")
-    if not path.is_file():
+    # One stat() instead of exists() + is_file()
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"{what} not found: {path}") from None
+    if not stat.S_ISREG(st.st_mode):
         raise IsADirectoryError(f"{what} is not a file: {path}")
     # Optionally check readability (on most systems, existence is enough)
 
 
 def main(argv: Optional[list[str]] = None) -> int:
     args = parse_args(argv)
+    warmup()
 
-    minutes_path = Path(args.minutes).expanduser().resolve()
-    results_path = Path(args.results).expanduser().resolve()
+    # expanduser() is string-only; resolve() walks every parent, so only do it for --verbose
+    minutes_path = Path(args.minutes).expanduser()
+    results_path = Path(args.results).expanduser()
+    if args.verbose:
+        minutes_path, results_path = minutes_path.resolve(), results_path.resolve()
 
     try:
         ensure_readable(minutes_path, "Minutes")
@@ -119,22 +129,8 @@ def main(argv: Optional[list[str]] = None) -> int:
     # Handle stdout mode early
     if args.stdout:
         try:
-            # Render to a temp file, then print its contents to stdout to keep renderer API simple
-            # If your render() can accept '-' for stdout in the future, switch to that.
-            from tempfile import NamedTemporaryFile
-
-            with NamedTemporaryFile(prefix="avsafe_", suffix=".html", delete=False) as tmp:
-                tmp_path = Path(tmp.name)
-            try:
-                render(str(minutes_path), str(results_path), str(tmp_path))
-                sys.stdout.write(tmp_path.read_text(encoding="utf-8"))
-                sys.stdout.flush()
-            finally:
-                # Best-effort cleanup
-                try:
-                    tmp_path.unlink(missing_ok=True)
-                except Exception:
-                    pass
+            sys.stdout.write(render_to_string(str(minutes_path), str(results_path)))
+            sys.stdout.flush()
             return EXIT_OK
         except Exception as e:
             if args.verbose:
@@ -12,51 +12,75 @@ Examples
   avsafe-sim --minutes 120 --start 2025-09-12T10:00:00Z --seed 42 --sign
   avsafe-sim --minutes 30 --third-range 100-5000 --audio-spike "t=10,dur=3,delta=8"
   avsafe-sim --minutes 90 --stdout --device-id DEV-001
+  avsafe-sim --minutes 10080 --jobs 0 --outfile week.jsonl.gz   # gzip, from the suffix
 
 Notes
 -----
-- Output is JSON Lines (one JSON object per line).
+- Output is JSON Lines (one JSON object per line); each line is the canonical JSON
+  payload (sorted keys, compact) followed by its 'chain' block.
 - Timestamps are UTC ISO 8601 with 'Z' suffix.
 - Signatures are of the canonical JSON payload (not including the 'chain' block).
+- With --jobs N, payloads are built in N worker processes and chained in order in
+  the main process; for a given --seed the output is the same for any N.
 """
 
 from __future__ import annotations
 
 import argparse
+import contextlib
 import datetime as dt
-import json
+import gzip
 import math
-import random
+import os
 import sys
 import traceback
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence, Tuple
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, BinaryIO, Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
+try:  # optional JIT (pip install .[speedups])
+    from numba import njit  # type: ignore
+    _HAVE_NUMBA = True
+except Exception:
+    _HAVE_NUMBA = False
+
+try:  # optional zstd output (pip install .[speedups])
+    import zstandard as _zstd  # type: ignore
+    _HAVE_ZSTD = True
+except Exception:
+    _HAVE_ZSTD = False
+
 # ---- Imports from project (prefer real helpers, gracefully degrade otherwise) ----
 _nominal_centers = None
-_overall_level_dba = None
+_a_weight_vector = None
+_a_weighted_level_sum = None
 try:
     # Correct paths for this repo layout
     from ..audio.third_octave import nominal_centers as _nominal_centers  # type: ignore
 except Exception:
     pass
 try:
-    from ..audio.a_weighting import overall_level_dba as _overall_level_dba  # type: ignore
+    from ..audio.a_weighting import (  # type: ignore
+        a_weight_vector as _a_weight_vector,
+        a_weighted_level_sum as _a_weighted_level_sum,
+    )
 except Exception:
     pass
 
 try:
-    from ..integrity.hash_chain import chain_hash, canonical_json  # type: ignore
-    from ..integrity.signing import sign_bytes  # type: ignore
+    from ..integrity.hash_chain import chain_digest, canonical_json  # type: ignore
+    from ..integrity.signing import sign_bytes, sign_many  # type: ignore
 except Exception as e:  # pragma: no cover
     print("FATAL: cannot import integrity utilities.", file=sys.stderr)
     raise
 
 # Light (Temporal Light Modulation) metrics
 try:
-    from ..light import window_metrics, MinuteAggregator  # type: ignore
+    from ..light import tlm_metrics, MinuteAggregator  # type: ignore
 except Exception as e:
     print("FATAL: light/TLM module not found. Add avsafe_descriptors/light/.", file=sys.stderr)
     raise
@@ -65,6 +89,18 @@ EXIT_OK = 0
 EXIT_BAD_ARGS = 2
 EXIT_RUNTIME = 1
 
+# Output is flushed to the file in batches of about this many bytes
+_WRITE_BATCH_BYTES = 1 << 16
+
+# Minutes whose random draws are generated together (bounds the jitter matrix size)
+_DRAW_BLOCK = 4096
+
+# Minutes per payload job; with --jobs > 1 each job is one worker task
+_JOB_MINUTES = 64
+
+# Reused (reset) for every simulated minute; one per process
+_MINUTE_AGG = MinuteAggregator()
+
 
 # ----------------------- helpers -----------------------
 
@@ -82,44 +118,101 @@ def _parse_iso_utc(s: Optional[str]) -> dt.datetime:
 
 
 def _utc_iso(dt_utc: dt.datetime) -> str:
-    return dt_utc.astimezone(dt.timezone.utc).isoformat().replace("+00:00", "Z")
+    # Single-datetime path (gen_minute_payload callers); main() formats whole blocks
+    # with _minute_timestamps. A UTC isoformat() always ends in "+00:00": slice, don't scan.
+    if dt_utc.tzinfo is not dt.timezone.utc:
+        dt_utc = dt_utc.astimezone(dt.timezone.utc)
+    return dt_utc.isoformat()[:-6] + "Z"
+
+
+def _minute_timestamps(start_utc: dt.datetime, first: int, n: int) -> List[str]:
+    """
+    ISO 8601 'Z' stamps for minutes first..first+n-1 after start_utc, formatted in one
+    vectorized call. Matches _utc_iso(): microseconds only when the start has them.
+    """
+    start = np.datetime64(start_utc.astimezone(dt.timezone.utc).replace(tzinfo=None), "us")
+    stamps = start + np.arange(first, first + n, dtype="timedelta64[m]")
+    unit = "us" if start_utc.microsecond else "s"
+    return [t + "Z" for t in np.datetime_as_string(stamps, unit=unit).tolist()]
+
 
+# Used when the audio module is unavailable: a conservative set of nominal centers (Hz)
+_FALLBACK_CENTERS: Tuple[float, ...] = (
+    20.0, 25.0, 31.5, 40.0, 50.0, 63.0, 80.0, 100.0, 125.0, 160.0,
+    200.0, 250.0, 315.0, 400.0, 500.0, 630.0, 800.0, 1000.0,
+    1250.0, 1600.0, 2000.0, 2500.0, 3150.0, 4000.0, 5000.0,
+)
 
-def _default_third_centers(fmin: float, fmax: float) -> List[float]:
-    """Nominal IEC 1/3-oct centers between fmin..fmax (Hz). Fallback to a small list if audio module missing."""
+
+@lru_cache(maxsize=32)
+def _default_third_centers(fmin: float, fmax: float) -> Tuple[float, ...]:
+    """Nominal IEC 1/3-oct centers between fmin..fmax (Hz). Fallback to a small set if audio module missing."""
     if _nominal_centers is not None:
-        return [float(x) for x in _nominal_centers(fmin_hz=fmin, fmax_hz=fmax)]
-    # Fallback conservative set
-    base = [20, 25, 31.5, 40, 50, 63, 80, 100, 125, 160,
-            200, 250, 315, 400, 500, 630, 800, 1000,
-            1250, 1600, 2000, 2500, 3150, 4000, 5000]
-    return [float(x) for x in base if fmin <= x <= fmax]
+        return tuple(float(x) for x in _nominal_centers(fmin_hz=fmin, fmax_hz=fmax))
+    return tuple(x for x in _FALLBACK_CENTERS if fmin <= x <= fmax)
+
 
+# (band keys, -6 dB/octave slope, A-weights or None) for one band grid
+_SpectrumLayout = Tuple[Tuple[str, ...], np.ndarray, Optional[np.ndarray]]
 
-def _pinkish_spectrum(centers: Sequence[float], laeq_target: float, rng: random.Random) -> Dict[str, float]:
+
+@lru_cache(maxsize=8)
+def _spectrum_layout(centers: Tuple[float, ...]) -> _SpectrumLayout:
+    """
+    Per-grid constants for _pinkish_spectrum: the output keys, the -6 dB/octave
+    slope relative to 1 kHz, and the A-weighting per band (None without the audio
+    module). All loop-invariant, so resolved once per grid (read-only, cached).
+    """
+    # Keys as nominal center frequencies; keep small ones with one decimal for readability
+    keys = tuple(str(int(round(c))) if c >= 100 else str(round(c, 1)) for c in centers)
+    c_arr = np.array(centers, dtype=np.float64)
+    slope = -6.0 * np.log2(c_arr / 1000.0)
+    slope.setflags(write=False)
+    a_w = _a_weight_vector(centers) if _a_weight_vector is not None else None
+    return keys, slope, a_w
+
+
+if _HAVE_NUMBA:
+    @njit(cache=True)
+    def _pink_levels(slope, laeq_target, jitter):  # pragma: no cover - needs numba
+        # Same expression as the NumPy fallback, fused into one pass (no fastmath,
+        # so levels stay bit-identical and the 0.1 dB rounding cannot drift)
+        out = np.empty_like(slope)
+        for i in range(slope.size):
+            out[i] = (laeq_target + slope[i]) + jitter[i]
+        return out
+else:
+    def _pink_levels(slope: np.ndarray, laeq_target: float, jitter: np.ndarray) -> np.ndarray:
+        return (laeq_target + slope) + jitter
+
+
+def _pinkish_spectrum(
+    centers: Sequence[float],
+    laeq_target: float,
+    jitter: np.ndarray,
+    layout: Optional[_SpectrumLayout] = None,
+    as_list: bool = False,
+) -> Union[Dict[str, float], List[float]]:
     """
     Create a pinkish 1/3-oct spectrum around a target LAeq (dB). If A-weighting is available,
     scale so that the A-weighted sum matches the target LAeq. Otherwise, just return a plausible shape.
+    `jitter` holds one pre-drawn N(0, 1.5) dB offset per band; `layout` is
+    _spectrum_layout(centers), passed in by callers that resolve it once per run.
     """
-    levels = []
-    for fc in centers:
-        octaves_from_1k = math.log2(fc / 1000.0)
-        base = laeq_target - 6.0 * octaves_from_1k + rng.gauss(0.0, 1.5)
-        levels.append(base)
+    keys, slope, a_w = layout if layout is not None else _spectrum_layout(tuple(centers))
+    levels = _pink_levels(slope, laeq_target, jitter)  # fresh array: adjusted in place below
 
     # If we can compute A-weighted sum, scale to match target
-    if _overall_level_dba is not None:
+    if a_w is not None:
         try:
-            computed = _overall_level_dba(levels, centers)  # type: ignore
-            if computed != float("-inf"):
-                delta = laeq_target - computed
-                levels = [L + delta for L in levels]
+            computed = _a_weighted_level_sum(levels, a_w)  # type: ignore
+            if computed != -math.inf:
+                levels += laeq_target - computed
         except Exception:
             pass
 
-    # Keys as nominal center frequencies; keep small ones with one decimal for readability
-    return {str(int(round(c))) if c >= 100 else str(round(c, 1)): round(L, 1)
-            for c, L in zip(centers, levels)}
+    rounded = np.round(levels, 1, out=levels).tolist()
+    return rounded if as_list else dict(zip(keys, rounded))
 
 
 def _apply_audio_spike(laeq: float, spike: Optional[Tuple[int, int, float]], idx: int) -> float:
@@ -138,6 +231,22 @@ def _apply_flicker_spike(mod_percent: float, spike: Optional[Tuple[int, int, flo
     return mod_percent + (delta if t0 <= idx < t0 + dur else 0.0)
 
 
+def _spike_offsets(spike: Optional[Tuple[int, int, float]], first: int, n: int) -> Optional[np.ndarray]:
+    """
+    Vector form of the spike helpers for minutes first..first+n-1: `delta` inside the
+    window, 0.0 elsewhere. None when there is no spike or it misses this range.
+    """
+    if not spike:
+        return None
+    t0, dur, delta = spike
+    lo, hi = max(t0 - first, 0), min(t0 + dur - first, n)
+    if lo >= hi:
+        return None
+    out = np.zeros(n)
+    out[lo:hi] = delta
+    return out
+
+
 def _parse_spike(s: Optional[str]) -> Optional[Tuple[int, int, float]]:
     """
     Parse spike spec like: "t=10,dur=3,delta=8" -> (10, 3, 8.0)
@@ -145,15 +254,64 @@ def _parse_spike(s: Optional[str]) -> Optional[Tuple[int, int, float]]:
     """
     if not s:
         return None
-    parts = dict(pair.split("=", 1) for pair in s.split(","))
-    t = int(parts.get("t", "0"))
-    dur = int(parts.get("dur", "1"))
-    delta = float(parts.get("delta", "6"))
+    t, dur, delta = 0, 1, 6.0
+    for pair in s.split(","):
+        key, sep, value = pair.partition("=")
+        if not sep:
+            raise ValueError(f"spike field {pair!r} is not key=value")
+        if key == "t":
+            t = int(value)
+        elif key == "dur":
+            dur = int(value)
+        elif key == "delta":
+            delta = float(value)
     if t < 0 or dur <= 0:
         raise ValueError("--audio-spike/--flicker-spike must have t>=0 and dur>0")
     return (t, dur, delta)
 
 
+def _compress_for(outfile: Optional[str]) -> str:
+    """Default --compress for an output path: by suffix (.gz / .zst), else none."""
+    suffix = Path(outfile).suffix.lower() if outfile else ""
+    return {".gz": "gzip", ".zst": "zstd"}.get(suffix, "none")
+
+
+def _open_output(stack: contextlib.ExitStack, path: Optional[Path], compress: str) -> BinaryIO:
+    """
+    Binary output stream for the run: the file at `path` (stdout if None), optionally
+    wrapped in a gzip or zstd compressor. Everything opened here is closed by `stack`;
+    stdout itself is left open.
+
+    Uncompressed output is an unbuffered raw file: the writer already hands over
+    ~64 KiB batches, so each one goes to os.write() without another copy through
+    a BufferedWriter (see _write_all for partial writes).
+    """
+    if compress == "none":
+        if path is None:
+            return stack.enter_context(open(sys.stdout.fileno(), "wb", buffering=0, closefd=False))
+        return stack.enter_context(open(path, "wb", buffering=0))
+    if path is None:
+        raw: BinaryIO = sys.stdout.buffer
+    else:
+        raw = stack.enter_context(open(path, "wb", buffering=_WRITE_BATCH_BYTES))
+    if compress == "gzip":
+        # Level 1: several times faster than 6 for most of the ratio on these records;
+        # mtime=0 keeps seeded runs byte-reproducible
+        return stack.enter_context(gzip.GzipFile(filename="", mode="wb", fileobj=raw, compresslevel=1, mtime=0))
+    if compress == "zstd":
+        cctx = _zstd.ZstdCompressor(level=3, threads=-1)
+        return stack.enter_context(cctx.stream_writer(raw, write_size=1 << 20, closefd=False))
+    return raw
+
+
+def _write_all(out_f: BinaryIO, buf: bytearray) -> None:
+    """Write all of `buf`; raw files and pipes may accept only part of a large write."""
+    with memoryview(buf) as view:
+        n = out_f.write(view)
+        while n < len(view):
+            n += out_f.write(view[n:])
+
+
 def _ensure_out_path(path: Path, overwrite: bool) -> None:
     parent = (Path.cwd() / path).parent if not path.is_absolute() else path.parent
     parent.mkdir(parents=True, exist_ok=True)
@@ -161,15 +319,63 @@ def _ensure_out_path(path: Path, overwrite: bool) -> None:
         raise FileExistsError(f"Output exists: {path}. Use --overwrite to replace.")
 
 
+@lru_cache(maxsize=4)
+def _sample_times(n: int, fs: float) -> np.ndarray:
+    """Sample instants arange(n)/fs for one synthesized minute (read-only, cached)."""
+    t = np.arange(n) / fs
+    t.setflags(write=False)
+    return t
+
+
+_NOISE_SCRATCH: Dict[int, np.ndarray] = {}
+
+
+def _noise_scratch(n: int) -> np.ndarray:
+    """Per-process buffer the light noise is drawn into (consumed before the next minute)."""
+    buf = _NOISE_SCRATCH.get(n)
+    if buf is None:
+        _NOISE_SCRATCH.clear()
+        buf = _NOISE_SCRATCH[n] = np.empty(n)
+    return buf
+
+
+if _HAVE_NUMBA:
+    @njit(cache=True)
+    def _light_fill(t, w, m, dc, noise, noise_rms):  # pragma: no cover - needs numba
+        # The NumPy fallback's in-place steps fused into one pass per sample (no
+        # fastmath, so the operation order and rounding are the same)
+        out = np.empty_like(t)
+        for i in range(t.size):
+            v = (math.sin(t[i] * w) * m + 1.0) * dc
+            if noise_rms > 0:
+                v += noise[i] * noise_rms
+            out[i] = v if v > 0.0 else 0.0
+        return out
+else:
+    def _light_fill(
+        t: np.ndarray, w: float, m: float, dc: float, noise: np.ndarray, noise_rms: float
+    ) -> np.ndarray:
+        # dc * (1 + m * sin(w t)) + noise_rms * noise, evaluated in place in the one output array
+        x = np.multiply(t, w)
+        np.sin(x, out=x)
+        x *= m
+        x += 1.0
+        x *= dc
+        if noise_rms > 0:
+            noise *= noise_rms
+            x += noise
+        return np.maximum(x, 0.0, out=x)
+
+
 def _synth_light_signal(
     seconds: float,
     fs: float,
     f0_hz: float,
     mod_percent: float,
-    rng: random.Random,
+    rng: np.random.Generator,
     dc: float = 1.0,
     noise_rms: float = 0.01
-) -> List[float]:
+) -> np.ndarray:
     """
     Simple non-negative 'lux-like' signal with sinusoidal TLM and a bit of noise.
     x(t) = dc * (1 + m * sin(2π f0 t)) + noise, clipped at 0
@@ -177,29 +383,103 @@ def _synth_light_signal(
     """
     n = int(round(seconds * fs))
     if n <= 0:
-        return [dc]
+        return np.array([dc])
     m = max(0.0, mod_percent) / 100.0
-    two_pi_f = 2.0 * math.pi * f0_hz
-    x = []
-    # Deterministic gaussian via RNG (Box–Muller)
-    for i in range(n):
-        t = i / fs
-        val = dc * (1.0 + m * math.sin(two_pi_f * t))
+    t = _sample_times(n, fs)  # same n and fs every minute of a run
+    noise = _noise_scratch(n)
+    if noise_rms > 0:
+        rng.standard_normal(n, out=noise)
+    return _light_fill(t, 2.0 * math.pi * f0_hz, m, dc, noise, noise_rms)
+
+
+def _light_windows(
+    seconds: float,
+    fs: float,
+    f0_hz: float,
+    mod_percent: float,
+    rng: np.random.Generator,
+    dc: float = 1.0,
+    noise_rms: float = 0.01,
+    window_s: float = 1.0,
+) -> Iterator[np.ndarray]:
+    """
+    The _synth_light_signal samples, synthesized one disjoint window at a time
+    (the 1 s / 1 s split window_metrics would make), so only one window is live.
+    Noise is drawn window by window from the same generator, which yields the
+    same stream as one full-length draw; any tail shorter than a window is dropped.
+    """
+    n = int(round(seconds * fs))
+    n_win = max(1, int(round(window_s * fs)))
+    if n < n_win:  # too short to window: one (possibly degenerate) segment
+        yield _synth_light_signal(seconds, fs, f0_hz, mod_percent, rng, dc, noise_rms)
+        return
+    m = max(0.0, mod_percent) / 100.0
+    w = 2.0 * math.pi * f0_hz
+    t = _sample_times(n, fs)
+    noise = _noise_scratch(n_win)
+    for start in range(0, n - n_win + 1, n_win):
         if noise_rms > 0:
-            u1, u2 = rng.random(), rng.random()
-            z = ( (-2.0*math.log(max(u1, 1e-12))) ** 0.5 ) * math.cos(2*math.pi*u2)
-            val += z * noise_rms
-        x.append(val if val > 0 else 0.0)
-    return x
+            rng.standard_normal(n_win, out=noise)
+        yield _light_fill(t[start:start + n_win], w, m, dc, noise, noise_rms)
+
+
+class MinuteDraw(NamedTuple):
+    """Random inputs for one simulated minute (see draw_minutes)."""
+    laeq: float
+    lcpeak_extra: float
+    tlm_freq: float
+    tlm_mod: float
+    band_jitter: np.ndarray
+    noise_seed: int  # seeds this minute's light-signal noise (keeps minutes independent)
+
+
+def draw_minutes(
+    rng: np.random.Generator,
+    n: int,
+    n_bands: int,
+    laeq_base: float,
+    laeq_sigma: float,
+    lcpeak_extra_range: Tuple[float, float],
+    tlm_freq_choices: Sequence[float],
+    tlm_mod_base: float,
+    tlm_mod_sigma: float,
+    first_idx: int = 0,
+    audio_spike: Optional[Tuple[int, int, float]] = None,
+    flicker_spike: Optional[Tuple[int, int, float]] = None,
+) -> List[MinuteDraw]:
+    """
+    Draw the per-minute random inputs for `n` minutes in a few vectorized calls.
+    Spikes given here are already applied to laeq / tlm_mod for minutes
+    first_idx..first_idx+n-1, so the draws must not be passed through them again.
+    """
+    laeq = rng.normal(laeq_base, laeq_sigma, n)
+    lc_extra = rng.uniform(lcpeak_extra_range[0], lcpeak_extra_range[1], n)
+    tlm_f = rng.choice(np.asarray(tlm_freq_choices, dtype=np.float64), n)
+    tlm_mod = np.maximum(0.0, rng.normal(tlm_mod_base, tlm_mod_sigma, n))
+    jitter = rng.normal(0.0, 1.5, (n, n_bands))
+    noise_seed = rng.integers(0, 1 << 63, n)
+
+    audio_delta = _spike_offsets(audio_spike, first_idx, n)
+    if audio_delta is not None:
+        laeq += audio_delta
+    flicker_delta = _spike_offsets(flicker_spike, first_idx, n)
+    if flicker_delta is not None:
+        tlm_mod += flicker_delta
+    return [
+        MinuteDraw(*row)
+        for row in zip(
+            laeq.tolist(), lc_extra.tolist(), tlm_f.tolist(), tlm_mod.tolist(), jitter,
+            noise_seed.tolist(),
+        )
+    ]
 
 
 # ----------------------- main generation -----------------------
 
-def gen_minute_record(
+def gen_minute_payload(
     idx: int,
-    ts_utc: dt.datetime,
-    prev_hash: Optional[str],
-    rng: random.Random,
+    ts_utc: Union[dt.datetime, str],
+    rng: np.random.Generator,
     centers: Sequence[float],
     laeq_base: float,
     laeq_sigma: float,
@@ -212,33 +492,40 @@ def gen_minute_record(
     flicker_spike: Optional[Tuple[int, int, float]],
     device_id: Optional[str],
     schema: str,
-    sign: bool,
+    draw: Optional[MinuteDraw] = None,
+    spectrum_layout: Optional[_SpectrumLayout] = None,
+    compact: bool = False,
 ) -> dict:
-    # Base LAeq and spectrum
-    laeq = rng.gauss(laeq_base, laeq_sigma)
-    laeq = _apply_audio_spike(laeq, audio_spike, idx)
-    bands = _pinkish_spectrum(centers, laeq, rng)
+    # Random inputs: pre-drawn in bulk by main(), or drawn here for one-off calls.
+    # Everything below depends only on `draw`, so minutes can be built in any order.
+    if draw is None:
+        draw = draw_minutes(
+            rng, 1, len(centers), laeq_base, laeq_sigma, lcpeak_extra_range,
+            tlm_freq_choices, tlm_mod_base, tlm_mod_sigma,
+        )[0]
+
+    # Base LAeq and spectrum (main() passes no spikes: they are already in its draws)
+    laeq = _apply_audio_spike(draw.laeq, audio_spike, idx) if audio_spike else draw.laeq
+    bands = _pinkish_spectrum(centers, laeq, draw.band_jitter, spectrum_layout, as_list=compact)
 
     # LCpeak offset
-    lcpeak = laeq + rng.uniform(*lcpeak_extra_range)
+    lcpeak = laeq + draw.lcpeak_extra
 
     # ---- Light / TLM path (simulate 60 s, compute minute summary) ----
-    tlm_f = float(rng.choice(tlm_freq_choices))
-    tlm_mod = max(0.0, rng.gauss(tlm_mod_base, tlm_mod_sigma))
-    tlm_mod = _apply_flicker_spike(tlm_mod, flicker_spike, idx)
-
-    light_fs = getattr(gen_minute_record, "_light_fs", 2000.0)           # injected from main()
-    mains_hint = getattr(gen_minute_record, "_mains_hint", 50.0)         # injected from main()
-    light_noise = getattr(gen_minute_record, "_light_noise_rms", 0.01)   # injected from main()
-
-    light = _synth_light_signal(
-        seconds=60.0, fs=light_fs, f0_hz=tlm_f, mod_percent=tlm_mod, rng=rng,
-        dc=1.0, noise_rms=light_noise
-    )
-    agg = MinuteAggregator()
-    for m in window_metrics(np.array(light, dtype=float), fs=light_fs,
-                            window_s=1.0, step_s=1.0, mains_hint=mains_hint):
-        agg.add(m)
+    tlm_f = draw.tlm_freq
+    tlm_mod = _apply_flicker_spike(draw.tlm_mod, flicker_spike, idx) if flicker_spike else draw.tlm_mod
+
+    light_fs = getattr(gen_minute_payload, "_light_fs", 2000.0)           # injected from main()
+    mains_hint = getattr(gen_minute_payload, "_mains_hint", 50.0)         # injected from main()
+    light_noise = getattr(gen_minute_payload, "_light_noise_rms", 0.01)   # injected from main()
+
+    agg = _MINUTE_AGG
+    agg.reset()
+    for seg in _light_windows(
+        seconds=60.0, fs=light_fs, f0_hz=tlm_f, mod_percent=tlm_mod,
+        rng=np.random.default_rng(draw.noise_seed), dc=1.0, noise_rms=light_noise
+    ):
+        agg.add(tlm_metrics(seg, light_fs, mains_hint))
     minute_light = agg.summary()
     # ---------------------------------------------------------------
 
@@ -246,7 +533,7 @@ def gen_minute_record(
     payload = {
         "schema": schema,
         "idx": idx,
-        "ts": _utc_iso(ts_utc),
+        "ts": ts_utc if isinstance(ts_utc, str) else _utc_iso(ts_utc),  # str: pre-formatted
         "device_id": device_id,
         "audio": {
             "laeq_db": round(laeq, 1),
@@ -265,15 +552,169 @@ def gen_minute_record(
         },
     }
 
-    # Chain & sign
-    h = chain_hash(prev_hash, payload)
-    record = payload | {"chain": {"hash": h}}
+    return payload
+
+
+def _chain_block(cj_bytes: bytes, prev_digest: Optional[bytes], sign: bool) -> Tuple[dict, bytes]:
+    """Chain (and optionally sign) canonical payload bytes; returns (chain_block, digest)."""
+    digest = chain_digest(prev_digest, cj_bytes)
+    chain = {"hash": digest.hex()}
     if sign:
-        sig_block = sign_bytes(canonical_json(payload).encode("utf-8"))
-        record["chain"] |= sig_block
+        chain |= sign_bytes(cj_bytes)
+    return chain, digest
+
+
+def _seal_canonical(cj: str, prev_digest: Optional[bytes], sign: bool) -> Tuple[dict, str, bytes]:
+    """
+    Chain (and optionally sign) a minute given as canonical JSON; returns
+    (chain_block, jsonl_line, digest).
+
+    The canonical JSON is reused for the hash, the signature and the output line,
+    which is the canonical payload with the 'chain' block spliced in before the
+    closing brace, newline-terminated. The link is carried as raw digest bytes;
+    only the written 'hash' is hex.
+    """
+    chain, digest = _chain_block(cj.encode("utf-8"), prev_digest, sign)
+    return chain, f'{cj[:-1]},"chain":{canonical_json(chain)}}}\n', digest
+
+
+def _seal_chunk_into(
+    buf: bytearray,
+    cjs: Sequence[str],
+    prev_digest: Optional[bytes],
+    sign: bool,
+    executor: Optional[Executor] = None,
+) -> Optional[bytes]:
+    """
+    _seal_canonical for the writer, a chunk of consecutive minutes at a time: appends
+    the sealed lines to `buf` in place and returns the last digest. Each payload is
+    encoded once, for the hash, the signature and the output; no per-line str is
+    built. Signatures are not part of the chain, so the chunk is signed as one batch
+    (sign_many, concurrently given an executor) while the links stay serial.
+    """
+    encoded = [cj.encode("utf-8") for cj in cjs]
+    sigs = sign_many(encoded, executor=executor) if sign else None
+    for k, cj_bytes in enumerate(encoded):
+        prev_digest = chain_digest(prev_digest, cj_bytes)
+        chain = {"hash": prev_digest.hex()}
+        if sigs is not None:
+            chain |= sigs[k]
+        buf += memoryview(cj_bytes)[:-1]
+        buf += b',"chain":'
+        buf += canonical_json(chain).encode("utf-8")
+        buf += b"}\n"
+    return prev_digest
+
+
+def _seal_line(payload: dict, prev_digest: Optional[bytes], sign: bool) -> Tuple[dict, str, bytes]:
+    """_seal_canonical for a payload dict: renders its canonical JSON once; the payload is not copied."""
+    return _seal_canonical(canonical_json(payload), prev_digest, sign)
+
+
+def seal_minute(payload: dict, prev_hash: Optional[str], sign: bool) -> Tuple[dict, str]:
+    """
+    Chain (and optionally sign) a minute payload. Returns (record, jsonl_line), where
+    record is the payload merged with its 'chain' block (see _seal_line).
+    """
+    chain, line, _ = _seal_line(payload, bytes.fromhex(prev_hash) if prev_hash else None, sign)
+    return payload | {"chain": chain}, line
+
+
+def gen_minute_record(
+    idx: int,
+    ts_utc: dt.datetime,
+    prev_hash: Optional[str],
+    rng: np.random.Generator,
+    centers: Sequence[float],
+    laeq_base: float,
+    laeq_sigma: float,
+    lcpeak_extra_range: Tuple[float, float],
+    tlm_freq_choices: Sequence[float],
+    tlm_mod_base: float,
+    tlm_mod_sigma: float,
+    flicker_index_range: Tuple[float, float],
+    audio_spike: Optional[Tuple[int, int, float]],
+    flicker_spike: Optional[Tuple[int, int, float]],
+    device_id: Optional[str],
+    schema: str,
+    sign: bool,
+) -> dict:
+    payload = gen_minute_payload(
+        idx, ts_utc, rng, centers, laeq_base, laeq_sigma, lcpeak_extra_range,
+        tlm_freq_choices, tlm_mod_base, tlm_mod_sigma, flicker_index_range,
+        audio_spike, flicker_spike, device_id, schema,
+    )
+    record, _ = seal_minute(payload, prev_hash, sign)
     return record
 
 
+def _compact_header(schema: str, layout: _SpectrumLayout) -> dict:
+    """First record of a --compact run: the band centers that every third_octave_db array follows."""
+    keys = layout[0]
+    return {
+        "schema": schema,
+        "type": "header",
+        "centers": [float(k) if "." in k else int(k) for k in keys],
+    }
+
+
+def _init_payload_worker(light_fs: float, mains_hint: float, light_noise_rms: float) -> None:
+    """ProcessPoolExecutor initializer: inject the light constants main() sets on gen_minute_payload."""
+    gen_minute_payload._light_fs = light_fs                 # type: ignore[attr-defined]
+    gen_minute_payload._mains_hint = mains_hint             # type: ignore[attr-defined]
+    gen_minute_payload._light_noise_rms = light_noise_rms   # type: ignore[attr-defined]
+
+
+def _canonical_payloads(job: Tuple[int, List[str], List[MinuteDraw], Dict[str, Any]]) -> List[str]:
+    """
+    Build and canonicalize a run of consecutive minutes: job is (first_idx, stamps,
+    draws, payload kwargs). Top-level so it can run in a worker process; the chain
+    is linked afterwards, in order, by the caller.
+    """
+    first, stamps, draws, opts = job
+    return [
+        canonical_json(gen_minute_payload(idx=first + k, ts_utc=ts, rng=None, draw=d, **opts))  # type: ignore[arg-type]
+        for k, (ts, d) in enumerate(zip(stamps, draws))
+    ]
+
+
+def _ordered_map(pool: ProcessPoolExecutor, fn, items: Iterable, window: int) -> Iterator:
+    """
+    Like pool.map, but keeps at most `window` tasks in flight instead of submitting
+    (and drawing inputs for) the whole run up front. Results come back in input order.
+    """
+    pending: Deque = deque()
+    for item in items:
+        pending.append(pool.submit(fn, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _payload_jobs(
+    rng: np.random.Generator,
+    start_utc: dt.datetime,
+    n_minutes: int,
+    n_bands: int,
+    draw_args: tuple,
+    opts: Dict[str, Any],
+    audio_spike: Optional[Tuple[int, int, float]] = None,
+    flicker_spike: Optional[Tuple[int, int, float]] = None,
+) -> Iterator[Tuple[int, List[str], List[MinuteDraw], Dict[str, Any]]]:
+    """
+    Draw inputs a block at a time (in order, from the one RNG) and cut them into jobs.
+    Spikes are folded into the draws here; `opts` should carry none.
+    """
+    for first in range(0, n_minutes, _DRAW_BLOCK):
+        n = min(_DRAW_BLOCK, n_minutes - first)
+        stamps = _minute_timestamps(start_utc, first, n)
+        draws = draw_minutes(rng, n, n_bands, *draw_args, first_idx=first, audio_spike=audio_spike,
+                             flicker_spike=flicker_spike)
+        for k in range(0, n, _JOB_MINUTES):
+            yield first + k, stamps[k:k + _JOB_MINUTES], draws[k:k + _JOB_MINUTES], opts
+
+
 def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     p = argparse.ArgumentParser(
         prog="avsafe-sim",
@@ -285,6 +726,7 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
             "  avsafe-sim --minutes 120 --start 2025-09-12T10:00:00Z --seed 42 --sign\n"
             "  avsafe-sim --minutes 30 --third-range 100-5000 --audio-spike t=10,dur=3,delta=8\n"
             "  avsafe-sim --minutes 90 --stdout --device-id DEV-001\n"
+            "  avsafe-sim --minutes 10080 --jobs 0 --seed 7 --outfile week.jsonl\n"
         ),
     )
     p.add_argument("--minutes", type=int, default=60, help="Number of minute records to generate. Default: 60")
@@ -293,6 +735,13 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     out_group.add_argument("--outfile", type=str, default="minutes.jsonl", help="Output JSONL path. Default: minutes.jsonl")
     out_group.add_argument("--stdout", action="store_true", help="Write to stdout instead of a file.")
     p.add_argument("--overwrite", action="store_true", help="Allow overwriting an existing outfile.")
+    p.add_argument("--compact", action="store_true",
+                   help="Write a header record with the band centers first, then each minute's\n"
+                        "third_octave_db as a plain array in that order (about half the bytes).\n"
+                        "Readers that expect the keyed form need the default layout.")
+    p.add_argument("--compress", choices=["none", "gzip", "zstd"], default=None,
+                   help="Compress the output stream (gzip at level 1; zstd needs the 'zstandard'\n"
+                        "package). Default: from the outfile suffix (.gz / .zst), else none")
     p.add_argument("--seed", type=int, default=None, help="Random seed for reproducibility.")
     p.add_argument("--sign", action="store_true", help="Sign each payload (ed25519 via integrity.signing).")
     p.add_argument("--device-id", type=str, default=None, help="Optional device identifier to embed in each record.")
@@ -332,6 +781,9 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     p.add_argument("--flicker-spike", type=str, default=None,
                    help="Inject Mod%% spike: 't=<start>,dur=<minutes>,delta=<percent>'.")
 
+    p.add_argument("--jobs", type=int, default=1,
+                   help="Worker processes for building payloads (0 = one per CPU); the chain\n"
+                        "is still linked in order. Output does not depend on it. Default: 1")
     p.add_argument("--verbose", action="store_true", help="Verbose tracebacks on errors.")
     return p.parse_args(argv)
 
@@ -339,8 +791,11 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
 def main(argv: Optional[List[str]] = None) -> int:
     args = parse_args(argv)
 
-    # RNG
-    rng = random.Random(args.seed)
+    # RNG (PCG64); per-minute inputs are drawn in blocks of _DRAW_BLOCK minutes
+    rng = np.random.default_rng(args.seed)
+    if _HAVE_NUMBA:
+        _pink_levels(np.zeros(2), 0.0, np.zeros(2))  # compile (or load cache) before the loop
+        _light_fill(np.zeros(2), 1.0, 0.0, 1.0, np.zeros(2), 0.0)
 
     # Parse time
     try:
@@ -354,7 +809,7 @@ def main(argv: Optional[List[str]] = None) -> int:
     # Bands
     try:
         if args.third_bands:
-            centers = [float(x.strip()) for x in args.third_bands.split(",") if x.strip()]
+            centers: Sequence[float] = [float(x.strip()) for x in args.third_bands.split(",") if x.strip()]
         else:
             lo, hi = (float(x) for x in args.third_range.split("-", 1))
             centers = _default_third_centers(lo, hi)
@@ -387,6 +842,16 @@ def main(argv: Optional[List[str]] = None) -> int:
         print(f"ERROR: spike spec: {e}", file=sys.stderr)
         return EXIT_BAD_ARGS
 
+    if args.jobs < 0:
+        print("ERROR: --jobs must be >= 0", file=sys.stderr)
+        return EXIT_BAD_ARGS
+    jobs = args.jobs or (os.cpu_count() or 1)
+    if args.compress is None:
+        args.compress = _compress_for(None if args.stdout else args.outfile)
+    if args.compress == "zstd" and not _HAVE_ZSTD:
+        print("ERROR: --compress zstd requires the 'zstandard' package (pip install .[speedups])", file=sys.stderr)
+        return EXIT_BAD_ARGS
+
     # Output
     if not args.stdout:
         out_path = Path(args.outfile).expanduser()
@@ -399,44 +864,77 @@ def main(argv: Optional[List[str]] = None) -> int:
             return EXIT_BAD_ARGS
 
     # Inject simulator constants for light signal synthesis
-    gen_minute_record._light_fs = float(args.light_fs)                 # type: ignore[attr-defined]
-    gen_minute_record._mains_hint = float(args.mains_hint)             # type: ignore[attr-defined]
-    gen_minute_record._light_noise_rms = float(args.light_noise_rms)   # type: ignore[attr-defined]
+    gen_minute_payload._light_fs = float(args.light_fs)                 # type: ignore[attr-defined]
+    gen_minute_payload._mains_hint = float(args.mains_hint)             # type: ignore[attr-defined]
+    gen_minute_payload._light_noise_rms = float(args.light_noise_rms)   # type: ignore[attr-defined]
 
     # Generate
-    prev_hash: Optional[str] = None
+    prev_digest: Optional[bytes] = None
     try:
         if args.stdout:
-            out_f = sys.stdout
-            close_needed = False
-        else:
-            out_f = open(out_path, "w", encoding="utf-8")
-            close_needed = True
-
-        with out_f:
-            for i in range(int(args.minutes)):
-                ts = start_utc + dt.timedelta(minutes=i)
-                rec = gen_minute_record(
-                    idx=i,
-                    ts_utc=ts,
-                    prev_hash=prev_hash,
-                    rng=rng,
-                    centers=centers,
-                    laeq_base=args.laeq_base,
-                    laeq_sigma=args.laeq_sigma,
-                    lcpeak_extra_range=(lc_min, lc_max),
-                    tlm_freq_choices=tlm_freqs,
-                    tlm_mod_base=args.tlm_mod_base,
-                    tlm_mod_sigma=args.tlm_mod_sigma,
-                    flicker_index_range=(fi_min, fi_max),
-                    audio_spike=audio_spike,
-                    flicker_spike=flicker_spike,
-                    device_id=args.device_id,
-                    schema=args.schema,
-                    sign=bool(args.sign),
-                )
-                prev_hash = rec["chain"]["hash"]
-                out_f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+            sys.stdout.flush()
+
+        buf = bytearray()
+        sign = bool(args.sign)
+        opts: Dict[str, Any] = dict(
+            centers=centers,
+            laeq_base=args.laeq_base,
+            laeq_sigma=args.laeq_sigma,
+            lcpeak_extra_range=(lc_min, lc_max),
+            tlm_freq_choices=tlm_freqs,
+            tlm_mod_base=args.tlm_mod_base,
+            tlm_mod_sigma=args.tlm_mod_sigma,
+            flicker_index_range=(fi_min, fi_max),
+            audio_spike=None,  # applied to the block draws by _payload_jobs
+            flicker_spike=None,
+            device_id=args.device_id,
+            schema=args.schema,
+            spectrum_layout=_spectrum_layout(tuple(centers)),  # band keys, slope: fixed for the run
+            compact=bool(args.compact),
+        )
+        if args.compact:
+            # Unchained: the centers are fixed by the run arguments, not measured data
+            buf += canonical_json(_compact_header(args.schema, opts["spectrum_layout"])).encode("utf-8")
+            buf += b"\n"
+        job_iter = _payload_jobs(
+            rng, start_utc, int(args.minutes), len(centers),
+            (args.laeq_base, args.laeq_sigma, (lc_min, lc_max),
+             tlm_freqs, args.tlm_mod_base, args.tlm_mod_sigma),
+            opts, audio_spike, flicker_spike,
+        )
+        pool: Optional[ProcessPoolExecutor] = None
+        if jobs > 1:
+            pool = ProcessPoolExecutor(
+                max_workers=jobs,
+                initializer=_init_payload_worker,
+                initargs=(float(args.light_fs), float(args.mains_hint), float(args.light_noise_rms)),
+            )
+        chunks: Iterable[List[str]] = (
+            _ordered_map(pool, _canonical_payloads, job_iter, 4 * jobs) if pool is not None
+            else map(_canonical_payloads, job_iter)
+        )
+        sign_pool: Optional[ThreadPoolExecutor] = None
+        if sign and (os.cpu_count() or 1) > 1:
+            sign_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+        try:
+            # Binary output; sealed lines are batched into ~64 KiB writes
+            with contextlib.ExitStack() as stack:
+                out_f = _open_output(stack, None if args.stdout else out_path, args.compress)
+                for chunk in chunks:
+                    # Only the lines and the hash are needed here, so skip the record merge
+                    prev_digest = _seal_chunk_into(buf, chunk, prev_digest, sign, sign_pool)
+                    if len(buf) >= _WRITE_BATCH_BYTES:
+                        _write_all(out_f, buf)
+                        buf.clear()
+                if buf:
+                    _write_all(out_f, buf)
+            if args.stdout:
+                sys.stdout.buffer.flush()
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+            if sign_pool is not None:
+                sign_pool.shutdown()
 
         if not args.stdout:
             print(f"Wrote {args.minutes} minutes to {out_path}")
@@ -5,21 +5,51 @@ Validate all HF-AVC case files against the JSON Schema.
 Usage:
   python cli/validate_cases.py
   python cli/validate_cases.py --dir hf_avc/cases --schema hf_avc/schemas/case_schema_v1.json
+  python cli/validate_cases.py --jobs 1   # validate in-process, one file at a time
 """
 
 from __future__ import annotations
-import argparse, json, sys
+import argparse, json, os, sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional, Tuple
 from jsonschema import Draft202012Validator, exceptions as jse  # pip install jsonschema
 
+from avsafe_descriptors.io.jsonl_io import loads_line
+
 def parse_args():
     ap = argparse.ArgumentParser()
     ap.add_argument("--dir", default="hf_avc/cases",
                     help="Directory with case JSON files.")
     ap.add_argument("--schema", default="hf_avc/schemas/case_schema_v1.json",
                     help="JSON Schema path.")
+    ap.add_argument("--jobs", type=int, default=0,
+                    help="Worker processes (0 = one per CPU, 1 = in-process). Default: 0")
     return ap.parse_args()
 
+
+@lru_cache(maxsize=4)
+def _validator(schema_text: str) -> Draft202012Validator:
+    """One validator per schema per process (keyed on the schema text, which is hashable)."""
+    return Draft202012Validator(json.loads(schema_text))
+
+
+def validate_one(path: str, schema_text: str) -> Tuple[str, Optional[str]]:
+    """
+    Validate one case file; returns (path, None) if valid, else (path, report).
+    Top-level so it can run in a worker process; printing is left to the caller
+    so output stays in file order.
+    """
+    try:
+        _validator(schema_text).validate(loads_line(Path(path).read_bytes()))
+        return path, None
+    except jse.ValidationError as e:
+        where = "/".join(map(str, e.path)) or "(root)"
+        return path, f"  -> {e.message}\n  at {where}\n"
+    except Exception as e:
+        return path, f"  -> {e}\n"
+
 def main() -> int:
     args = parse_args()
     schema_path = Path(args.schema)
@@ -32,22 +62,36 @@ def main() -> int:
         print(f"FATAL: cases directory not found: {cases_dir}", file=sys.stderr)
         return 2
 
-    schema = json.loads(schema_path.read_text(encoding="utf-8"))
-    validator = Draft202012Validator(schema)
+    if args.jobs < 0:
+        print("FATAL: --jobs must be >= 0", file=sys.stderr)
+        return 2
+
+    schema_text = schema_path.read_text(encoding="utf-8")
+    try:
+        _validator(schema_text)  # fail fast on a malformed schema, before forking
+    except json.JSONDecodeError as e:
+        print(f"FATAL: schema is not valid JSON: {schema_path}: {e}", file=sys.stderr)
+        return 2
+
+    paths = [str(p) for p in sorted(cases_dir.glob("*.json"))]
+    jobs = min(args.jobs or (os.cpu_count() or 1), len(paths) or 1)
 
     errors = 0
-    for p in sorted(cases_dir.glob("*.json")):
-        try:
-            data = json.loads(p.read_text(encoding="utf-8"))
-            validator.validate(data)
-            print(f"OK   {p}")
-        except jse.ValidationError as e:
-            errors += 1
-            path = "/".join(map(str, e.path)) or "(root)"
-            print(f"FAIL {p}\n  -> {e.message}\n  at {path}\n", file=sys.stderr)
-        except Exception as e:
-            errors += 1
-            print(f"FAIL {p}\n  -> {e}\n", file=sys.stderr)
+    pool: Optional[ProcessPoolExecutor] = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    try:
+        results = (
+            pool.map(validate_one, paths, [schema_text] * len(paths), chunksize=8) if pool is not None
+            else (validate_one(p, schema_text) for p in paths)
+        )
+        for p, report in results:
+            if report is None:
+                print(f"OK   {p}")
+            else:
+                errors += 1
+                print(f"FAIL {p}\n{report}", file=sys.stderr)
+    finally:
+        if pool is not None:
+            pool.shutdown()
 
     if errors:
         print(f"{errors} file(s) failed validation.", file=sys.stderr)
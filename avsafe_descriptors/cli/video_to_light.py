@@ -8,9 +8,10 @@ Examples:
   avsafe-video-to-light --in clip.mp4 --minute --jsonl out.jsonl
 """
 from __future__ import annotations
-import argparse, json, sys, pathlib
+import argparse, sys, pathlib
 from typing import Optional
 
+from avsafe_descriptors.io.jsonl_io import dumps_line
 from avsafe_descriptors.video.luma import read_video_luma
 from avsafe_descriptors.light import window_metrics, MinuteAggregator
 
@@ -28,23 +29,27 @@ def parse_args(argv=None):
 
 def main(argv=None) -> int:
     args = parse_args(argv)
-    out_f = sys.stdout if args.jsonl in (None, "-") else open(args.jsonl, "w", encoding="utf-8")
+    # Rows are serialized to bytes (orjson when installed) and written once per input file
+    out_f = sys.stdout.buffer if args.jsonl in (None, "-") else open(args.jsonl, "wb")
     try:
         with out_f:
             for path in args.in_paths:
                 y, fs = read_video_luma(path, fps_override=args.fps_override)
+                source = str(pathlib.Path(path).name)
                 if args.minute:
                     agg = MinuteAggregator()
                     for m in window_metrics(y, fs=fs, window_s=args.window_s, step_s=args.step_s,
                                             mains_hint=args.mains_hint):
                         agg.add(m)
-                    row = {"source": str(pathlib.Path(path).name)} | agg.summary()
-                    out_f.write(json.dumps(row) + "\n")
+                    out_f.write(dumps_line({"source": source} | agg.summary()) + b"\n")
                 else:
-                    for m in window_metrics(y, fs=fs, window_s=args.window_s, step_s=args.step_s,
-                                            mains_hint=args.mains_hint):
-                        row = {"source": str(pathlib.Path(path).name)} | m
-                        out_f.write(json.dumps(row) + "\n")
+                    lines = [
+                        dumps_line({"source": source} | m)
+                        for m in window_metrics(y, fs=fs, window_s=args.window_s, step_s=args.step_s,
+                                                mains_hint=args.mains_hint)
+                    ]
+                    if lines:
+                        out_f.write(b"\n".join(lines) + b"\n")
         return 0
     except Exception as e:
         print(f"ERROR: {e}", file=sys.stderr)
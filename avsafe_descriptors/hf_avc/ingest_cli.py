@@ -7,15 +7,22 @@ Ingest HF-AVC case JSON files into a SQLite corpus DB.
 - Supports v2 case structure; maps legacy v1 fields when encountered.
 - Normalizes key fields into columns; stores full raw JSON and a content hash.
 - Idempotent: if the content hash hasn't changed, the row is skipped.
+- Files whose raw bytes match a stored file_sha are skipped before parsing.
 """
 
-import argparse, json, hashlib, sys
+import argparse, fnmatch, json, hashlib, os, re, sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, Iterable, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from sqlalchemy.engine import Engine
 
+from avsafe_descriptors.io.jsonl_io import loads_line
+from avsafe_descriptors.io.sqlite_store import open_engine
+
 # Optional: JSON Schema validation
 try:
     from jsonschema import Draft202012Validator
@@ -23,6 +30,20 @@ try:
 except Exception:
     HAVE_JSONSCHEMA = False
 
+# Optional: schema compiled to a Python function (pip install .[speedups])
+try:
+    import fastjsonschema  # type: ignore
+    HAVE_FASTJSONSCHEMA = True
+except Exception:
+    HAVE_FASTJSONSCHEMA = False
+
+# Optional: orjson for canonical bytes (pip install .[speedups])
+try:
+    import orjson  # type: ignore
+    HAVE_ORJSON = True
+except Exception:
+    HAVE_ORJSON = False
+
 
 # ------------------------
 # Utility functions
@@ -33,27 +54,102 @@ def canonical_json(obj: Any) -> str:
     return json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
 
 
-def sha256_hex(s: str) -> str:
-    return hashlib.sha256(s.encode("utf-8")).hexdigest()
+# Where orjson's float text can differ from json.dumps (exponent forms: 1e16 vs
+# 1e+16, 0.00001 vs 1e-05). A hit anywhere, even inside a string, means "use json".
+# Checked as substrings after folding digits to "0" (a regex scan costs more than
+# the orjson encode itself).
+_DIGITS_TO_0 = bytes.maketrans(b"123456789", b"000000000")
+
+
+def _float_form_may_differ(out: bytes) -> bool:
+    return b"0.0000" in out or b"0e" in out.translate(_DIGITS_TO_0)
+
+
+def canonical_json_bytes(obj: Any, source: Optional[bytes] = None) -> bytes:
+    """
+    canonical_json(obj) encoded as UTF-8, byte for byte (stored hashes depend on it).
+    orjson is used only when `source` (the bytes obj was parsed from) shows it gives
+    the same text: no NaN/Infinity in the input (orjson writes those as null) and no
+    float in an exponent form. Anything else goes through json.dumps.
+    """
+    if HAVE_ORJSON and source is not None and b"NaN" not in source and b"Infinity" not in source:
+        try:
+            out = orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+        except orjson.JSONEncodeError:  # e.g. integers beyond 64 bits
+            out = None
+        if out is not None and not _float_form_may_differ(out):
+            return out
+    return canonical_json(obj).encode("utf-8")
+
+
+def sha256_hex(s: Union[str, bytes]) -> str:
+    return hashlib.sha256(s.encode("utf-8") if isinstance(s, str) else s).hexdigest()
 
 
 def load_json(path: Path) -> Dict[str, Any]:
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    # orjson when installed; raw_json/json_hash come from canonical_json(_bytes) above
+    return loads_line(path.read_bytes())
+
+
+# 2019-09/2020-12 keywords fastjsonschema (drafts 4/6/7) does not implement;
+# a schema using any of them stays on jsonschema
+_NOT_IN_DRAFT7 = frozenset({
+    "prefixItems", "unevaluatedProperties", "unevaluatedItems", "dependentRequired",
+    "dependentSchemas", "minContains", "maxContains", "$anchor", "$dynamicRef", "$dynamicAnchor",
+})
+
+
+def _schema_keywords(node: Any, kw: set, formats: set) -> None:
+    if isinstance(node, dict):
+        kw.update(node)
+        if isinstance(node.get("format"), str):
+            formats.add(node["format"])
+        for v in node.values():
+            _schema_keywords(v, kw, formats)
+    elif isinstance(node, list):
+        for v in node:
+            _schema_keywords(v, kw, formats)
+
+
+def _compile_fast(schema: Dict[str, Any]):
+    """fastjsonschema validator with the same verdicts as Draft202012Validator, or None."""
+    kw: set = set()
+    formats: set = set()
+    _schema_keywords(schema, kw, formats)
+    if kw & _NOT_IN_DRAFT7:
+        return None
+    # Draft202012Validator (no format_checker) treats "format" as an annotation
+    no_format_checks = {name: (lambda _v: True) for name in formats}
+    try:
+        return fastjsonschema.compile(schema, formats=no_format_checks)
+    except fastjsonschema.JsonSchemaDefinitionException:
+        return None
 
 
 def load_schema(schema_path: Path):
-    if not HAVE_JSONSCHEMA:
+    if not (HAVE_JSONSCHEMA or HAVE_FASTJSONSCHEMA):
         return None
     schema = load_json(schema_path)
+    if HAVE_FASTJSONSCHEMA:
+        fast = _compile_fast(schema)
+        if fast is not None:
+            return fast
+    if not HAVE_JSONSCHEMA:
+        return None
     return Draft202012Validator(schema)
 
 
 def validate_case(validator, obj: Dict[str, Any], file: Path) -> None:
-    """Raises jsonschema.ValidationError on failure."""
+    """
+    Raises jsonschema.ValidationError (or fastjsonschema.JsonSchemaValueException
+    for a compiled validator) on failure.
+    """
     if validator is None:
         return
-    validator.validate(obj)
+    if hasattr(validator, "validate"):
+        validator.validate(obj)
+    else:
+        validator(obj)  # fastjsonschema: the compiled function itself
 
 
 # ------------------------
@@ -86,6 +182,7 @@ CREATE TABLE IF NOT EXISTS hf_cases (
   schema_version TEXT,
   json_hash TEXT NOT NULL,
   raw_json TEXT NOT NULL,
+  file_sha TEXT,
   ingested_at TEXT DEFAULT CURRENT_TIMESTAMP
 );
 
@@ -102,7 +199,7 @@ INSERT INTO hf_cases (
   tlm_freq_min, tlm_freq_max, tlm_mod_min, tlm_mod_max,
   flicker_index_min, flicker_index_max,
   who_night_guideline_db, who_likely_exceeded,
-  schema_version, json_hash, raw_json
+  schema_version, json_hash, raw_json, file_sha
 )
 VALUES (
   :id, :title, :country_iso2, :place, :period_start, :period_end,
@@ -111,7 +208,7 @@ VALUES (
   :tlm_freq_min, :tlm_freq_max, :tlm_mod_min, :tlm_mod_max,
   :flicker_index_min, :flicker_index_max,
   :who_night_guideline_db, :who_likely_exceeded,
-  :schema_version, :json_hash, :raw_json
+  :schema_version, :json_hash, :raw_json, :file_sha
 )
 ON CONFLICT(id) DO UPDATE SET
   title=excluded.title,
@@ -137,19 +234,35 @@ ON CONFLICT(id) DO UPDATE SET
   schema_version=excluded.schema_version,
   json_hash=excluded.json_hash,
   raw_json=excluded.raw_json,
+  file_sha=excluded.file_sha,
   ingested_at=CURRENT_TIMESTAMP
 WHERE hf_cases.json_hash IS DISTINCT FROM excluded.json_hash;
 """
+# The bulk path binds positionally on the raw sqlite3 connection: same statement
+# with "?" placeholders, and rows as tuples in UPSERT's parameter order
+UPSERT_COLUMNS = tuple(re.findall(r":(\w+)", UPSERT))
+UPSERT_Q = re.sub(r":\w+", "?", UPSERT)
+_row_values = itemgetter(*UPSERT_COLUMNS)
+
+# Unchanged content, new file bytes (reformatted, or ingested before file_sha existed)
+SET_FILE_SHA_Q = "UPDATE hf_cases SET file_sha=? WHERE id=?"
+
+# Changed rows are written every INGEST_BATCH files (bounds memory and savepoint redo)
+INGEST_BATCH = 500
+INGEST_WAL_AUTOCHECKPOINT = 10000  # pages
 
 
 def get_engine(db_path: Path) -> Engine:
-    eng = create_engine(f"sqlite:///{db_path}")
-    # Initialize WAL & schema
+    # Shared engine: every connection gets WAL, synchronous=NORMAL, in-memory temp store
+    eng = open_engine(db_path)
     with eng.begin() as cx:
-        cx.execute(text("PRAGMA journal_mode=WAL"))
-        for stmt in DDL.strip().split(";\n\n"):
+        for stmt in DDL.split(";"):  # sqlite3 runs one statement per execute()
             if stmt.strip():
                 cx.execute(text(stmt))
+        # DBs created before file_sha was added
+        cols = {r[1] for r in cx.execute(text("PRAGMA table_info(hf_cases)"))}
+        if "file_sha" not in cols:
+            cx.execute(text("ALTER TABLE hf_cases ADD COLUMN file_sha TEXT"))
     return eng
 
 
@@ -265,59 +378,204 @@ def map_case(obj: Dict[str, Any]) -> Dict[str, Any]:
 # Ingest
 # ------------------------
 
+def _flush_upserts(
+    cx,
+    pending: List[Tuple[Path, Dict[str, Any], bool]],
+    strict: bool,
+    known: Dict[Any, Tuple[str, Optional[str]]],
+) -> Tuple[int, int]:
+    """
+    Upsert a batch of mapped rows with one executemany; returns (inserted, updated).
+    If the batch is rejected, it is rolled back to a savepoint and redone row by row
+    so only the offending files fail (unless strict). `known` (id -> (json_hash,
+    file_sha)) is updated for the rows actually written.
+    """
+    if not pending:
+        return 0, 0
+    # Plain sqlite3 on this transaction's own connection: no per-row SQLAlchemy binding
+    dbapi = cx.connection.driver_connection
+    try:
+        with cx.begin_nested():
+            dbapi.executemany(UPSERT_Q, [_row_values(row) for _, row, _ in pending])
+        written = pending
+    except Exception:
+        if strict:
+            raise
+        written = []
+        for p, row, existed in pending:
+            try:
+                dbapi.execute(UPSERT_Q, _row_values(row))
+                written.append((p, row, existed))
+            except Exception as e:
+                print(f"[FAIL] {p}: {e}", file=sys.stderr)
+
+    inserted = updated = 0
+    for p, row, existed in written:
+        known[row["id"]] = (row["json_hash"], row["file_sha"])
+        if existed:
+            updated += 1
+            print(f"[UPD ] {p} -> id={row['id']}")
+        else:
+            inserted += 1
+            print(f"[OK  ] {p} -> id={row['id']}")
+    return inserted, updated
+
+
+@lru_cache(maxsize=4)
+def _validator_for(schema_path: Optional[str]):
+    """load_schema, once per schema per process (None: no validation)."""
+    return load_schema(Path(schema_path)) if schema_path else None
+
+
+def prep_case(job: Tuple[str, Optional[str]]) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Parse, validate, canonicalize, hash and map one case file: job is (path, schema path
+    or None). Returns (row, None), or (None, error message) on failure. Top-level and
+    DB-free so it can run in a worker process; the writes stay in the caller.
+    """
+    path, schema_path = job
+    try:
+        src = Path(path).read_bytes()
+        obj = loads_line(src)
+        # Validate (if schema present)
+        validate_case(_validator_for(schema_path), obj, Path(path))
+
+        raw_bytes = canonical_json_bytes(obj, src)
+        row = map_case(obj)
+        row["json_hash"] = sha256_hex(raw_bytes)
+        row["raw_json"] = raw_bytes.decode("utf-8")
+        row["file_sha"] = sha256_hex(src)
+        return row, None
+    except Exception as e:
+        return None, str(e)
+
+
 def ingest_files(
     db_path: Path,
     case_paths: Iterable[Path],
     schema_path: Optional[Path],
     strict: bool = False,
     dry_run: bool = False,
+    jobs: int = 1,
 ) -> Tuple[int, int, int]:
     """
     Returns (ok_count, updated_count, skipped_same_hash_count).
+
+    Without a schema, a file whose raw bytes hash to a stored file_sha is skipped
+    without parsing it: the row for its id was written from exactly those bytes (if an
+    earlier file in this run rewrote that row, it is prepared after all). With a
+    schema, every file is validated, since the stored row says nothing about the
+    schema in use now. The rest are prepared by prep_case, in `jobs` worker processes
+    when jobs > 1 (0 = one per CPU); results are consumed in file order and written
+    from this process.
     """
     eng = get_engine(db_path)
-    validator = load_schema(schema_path) if (schema_path and schema_path.exists()) else None
+    schema_key = str(schema_path) if (schema_path and schema_path.exists()) else None
 
     ok = updated = same = 0
 
     with eng.begin() as cx:
+        # Bulk write: let the WAL grow to ~40 MB between checkpoints instead of
+        # the default 1000 pages (this CLI's connection only; the rest are shared PRAGMAs)
+        cx.execute(text(f"PRAGMA wal_autocheckpoint={INGEST_WAL_AUTOCHECKPOINT}"))
+        # pysqlite only issues BEGIN before DML, so the per-batch SAVEPOINTs below would
+        # each start (and on RELEASE commit) their own transaction: open the real one now
+        dbapi = cx.connection.driver_connection
+        if not dbapi.in_transaction:
+            dbapi.execute("BEGIN")
+        # Current hashes in one query instead of a SELECT per file; kept up to date
+        # from the rows actually written, so a case id seen twice in one run is
+        # handled as before
+        known: Dict[Any, Tuple[str, Optional[str]]] = {} if dry_run else {
+            rid: (h, fsha)
+            for rid, h, fsha in cx.execute(text("SELECT id, json_hash, file_sha FROM hf_cases"))
+        }
+        # Raw-bytes skip only when nothing would be validated: stored file_sha -> id
+        known_files: Dict[str, Any] = {} if schema_key is not None else {
+            fsha: rid for rid, (_, fsha) in known.items() if fsha
+        }
+        file_sha_updates: List[Tuple[str, Any]] = []  # (file_sha, id)
+        pending: List[Tuple[Path, Dict[str, Any], bool]] = []  # (path, row, existed), flushed per batch
+        queued: Set[Any] = set()  # ids in pending
+
+        # Cheap pass first: raw-bytes hash, so unchanged files never reach a worker
+        todo: List[Tuple[Path, Optional[Tuple[str, Any]]]] = []  # (path, (file_sha, id) if stored)
         for p in case_paths:
+            if not known_files:
+                todo.append((p, None))
+                continue
             try:
-                obj = load_json(p)
-                # Validate (if schema present)
-                validate_case(validator, obj, p)
-
-                raw = canonical_json(obj)
-                h = sha256_hex(raw)
-                row = map_case(obj)
-                row["json_hash"] = h
-                row["raw_json"] = raw
+                fsha = sha256_hex(p.read_bytes())
+            except OSError:
+                todo.append((p, None))  # reported by prep_case below
+                continue
+            todo.append((p, (fsha, known_files[fsha]) if fsha in known_files else None))
+
+        jobs = min(jobs or (os.cpu_count() or 1), sum(1 for _, hit in todo if hit is None)) or 1
+        pool: Optional[ProcessPoolExecutor] = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+        try:
+            prep_jobs = [(str(p), schema_key) for p, hit in todo if hit is None]
+            prepared = (
+                pool.map(prep_case, prep_jobs, chunksize=16) if pool is not None
+                else map(prep_case, prep_jobs)
+            )
+            for p, hit in todo:
+                if hit is not None:
+                    # Still the bytes behind the row, unless this run already replaced it
+                    fsha, rid = hit
+                    if rid not in queued and known[rid][1] == fsha:
+                        same += 1
+                        print(f"[SKIP] {p} unchanged (same file)")
+                        continue
+                    row, err = prep_case((str(p), schema_key))
+                else:
+                    row, err = next(prepared)
+                if row is None:
+                    msg = f"[FAIL] {p}: {err}"
+                    if strict:
+                        raise RuntimeError(msg)
+                    print(msg, file=sys.stderr)
+                    continue
 
                 if dry_run:
                     print(f"[DRY] Would ingest {p} -> id={row['id']}")
                     ok += 1
                     continue
 
+                # Same id already queued: write it first so `known` reflects its outcome
+                if row["id"] in queued:
+                    counts = _flush_upserts(cx, pending, strict, known)
+                    ok += counts[0]
+                    updated += counts[1]
+                    pending, queued = [], set()
+
                 # If row exists with same hash, skip
-                existing = cx.execute(text("SELECT json_hash FROM hf_cases WHERE id = :id"), {"id": row["id"]}).fetchone()
-                if existing and existing[0] == h:
+                h, fsha = row["json_hash"], row["file_sha"]
+                existing = known.get(row["id"])
+                if existing is not None and existing[0] == h:
                     same += 1
                     print(f"[SKIP] {p} unchanged (same hash)")
+                    if existing[1] != fsha:  # remember these bytes for the fast path
+                        file_sha_updates.append((fsha, row["id"]))
+                        known[row["id"]] = (h, fsha)
                     continue
 
-                cx.execute(text(UPSERT), row)
-                if existing:
-                    updated += 1
-                    print(f"[UPD ] {p} -> id={row['id']}")
-                else:
-                    ok += 1
-                    print(f"[OK  ] {p} -> id={row['id']}")
-
-            except Exception as e:
-                msg = f"[FAIL] {p}: {e}"
-                if strict:
-                    raise RuntimeError(msg) from e
-                print(msg, file=sys.stderr)
+                pending.append((p, row, existing is not None))
+                queued.add(row["id"])
+                if len(pending) >= INGEST_BATCH:
+                    counts = _flush_upserts(cx, pending, strict, known)
+                    ok += counts[0]
+                    updated += counts[1]
+                    pending, queued = [], set()
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+        counts = _flush_upserts(cx, pending, strict, known)
+        ok += counts[0]
+        updated += counts[1]
+        if file_sha_updates:
+            dbapi.executemany(SET_FILE_SHA_Q, file_sha_updates)
 
     return ok, updated, same
 
@@ -326,12 +584,34 @@ def ingest_files(
 # CLI
 # ------------------------
 
+def _has_magic(s: str) -> bool:
+    return any(c in s for c in "*?[")
+
+
 def iter_globs(globs: Iterable[str]) -> Iterable[Path]:
     for g in globs:
-        # Support both file and glob
-        for p in Path().glob(g):
-            if p.is_file() and p.suffix.lower() == ".json":
+        head, tail = os.path.split(g)
+        if not _has_magic(g):
+            # A plain file path
+            p = Path(g)
+            if p.suffix.lower() == ".json" and p.is_file():
                 yield p
+        elif not _has_magic(head) and "**" not in tail:
+            # Wildcards only in the file name (the usual cases/*.json): one scandir
+            # pass, typed from the dirent instead of a stat per match
+            try:
+                entries = os.scandir(head or ".")
+            except OSError:
+                continue
+            with entries:
+                for e in entries:
+                    if (e.name.lower().endswith(".json") and fnmatch.fnmatch(e.name, tail)
+                            and e.is_file()):
+                        yield Path(head, e.name)
+        else:
+            for p in Path().glob(g):
+                if p.is_file() and p.suffix.lower() == ".json":
+                    yield p
 
 
 def main() -> None:
@@ -342,7 +622,12 @@ def main() -> None:
     ap.add_argument("--no-validate", action="store_true", help="Skip JSON Schema validation.")
     ap.add_argument("--strict", action="store_true", help="Fail immediately on first error.")
     ap.add_argument("--dry-run", action="store_true", help="Parse/validate only; no DB writes.")
+    ap.add_argument("--jobs", type=int, default=0,
+                    help="Worker processes for parse/validate/hash (0 = one per CPU, 1 = in-process).")
     args = ap.parse_args()
+    if args.jobs < 0:
+        print("--jobs must be >= 0", file=sys.stderr)
+        sys.exit(2)
 
     db_path = Path(args.db)
     case_paths = list(iter_globs(args.cases))
@@ -352,7 +637,8 @@ def main() -> None:
 
     schema_path = None if args.no_validate else Path(args.schema)
 
-    ok, upd, same = ingest_files(db_path, case_paths, schema_path, strict=args.strict, dry_run=args.dry_run)
+    ok, upd, same = ingest_files(db_path, case_paths, schema_path, strict=args.strict,
+                                 dry_run=args.dry_run, jobs=args.jobs)
     print(f"\nSummary: inserted={ok}, updated={upd}, unchanged={same}, total_seen={ok+upd+same}")
 
 
@@ -108,14 +108,17 @@ class AudioDescriptor(BaseModel):
         if v is None:
             return {}
         out: Dict[str, float] = {}
-        for k, val in dict(v).items():
+        # No copy for the usual dict; other mappings / pair lists still go through dict()
+        items = v.items() if isinstance(v, dict) else dict(v).items()
+        for k, val in items:
             try:
                 f = float(k)
                 if not (10.0 <= f <= 40000.0):
                     # Keep but don’t fail; downstream can filter
                     pass
                 # Format key without unnecessary decimals (e.g., "125")
-                key = str(int(f)) if abs(f - int(f)) < 1e-9 else str(f)
+                i = int(f)
+                key = str(i) if abs(f - i) < 1e-9 else str(f)
                 out[key] = float(val)
             except Exception:
                 # Ignore unparseable keys silently
@@ -162,11 +165,8 @@ class Jurisdiction(BaseModel):
     def _norm_iso2(cls, v: Optional[str]) -> Optional[str]:
         if v is None:
             return v
-        v = v.strip().upper()
-        if not re.fullmatch(r"[A-Z]{2}", v):
-            # Don’t fail; keep raw token
-            return v
-        return v
+        # Uppercased either way; tokens that aren't two letters are kept, not rejected
+        return v.strip().upper()
 
 
 class Period(BaseModel):
@@ -37,6 +37,10 @@ def canonical_json(obj: Any) -> str:
       - UTF-8, sorted keys
       - minimal separators
       - NaN/Infinity rejected (ensures cross-runtime consistency)
+
+    Deliberately stdlib json, not orjson: orjson formats some floats differently
+    (1e-05 -> 0.00001, 1e+16 -> 1e16), which would change hashes and signatures
+    depending on which package happens to be installed.
     """
     return json.dumps(
         obj,
@@ -46,6 +50,11 @@ def canonical_json(obj: Any) -> str:
         allow_nan=False,
     )
 
+
+def canonical_json_bytes(obj: Any) -> bytes:
+    """UTF-8 bytes of canonical_json(obj) — the exact bytes that get hashed/signed."""
+    return canonical_json(obj).encode("utf-8")
+
 # -------------------------
 # Hash selection & helpers
 # -------------------------
@@ -65,10 +74,64 @@ def _new_hasher(alg: str):
 # If you change this, bump the version suffix.
 DOMAIN = b"avsafe:chain:v1"
 
+# Hashers already fed with a domain label, keyed by (alg, domain). Each link starts
+# from a .copy() of one of these instead of building and re-feeding a fresh context.
+_SEEDED: Dict[Tuple[str, bytes], Any] = {}
+
+
+def _seeded_hasher(alg: str, domain: bytes):
+    key = (alg, domain)
+    base = _SEEDED.get(key)
+    if base is None:
+        base = _new_hasher(alg)
+        base.update(domain)
+        _SEEDED[key] = base
+    return base.copy()
+
 # -------------------------
 # Core API
 # -------------------------
 
+def chain_digest(
+    prev_digest: Optional[bytes],
+    payload_bytes: bytes,
+    *,
+    alg: str = "sha256",
+    domain: bytes = DOMAIN,
+) -> bytes:
+    """
+    Raw-digest form of chain_hash_bytes: the previous link is passed as digest bytes
+    and the result is returned as bytes, so a writer that carries the chain forward
+    skips the hex encode/decode round trip on every link.
+    """
+    h = _seeded_hasher(alg, domain)
+    if prev_digest:
+        h.update(prev_digest)
+    h.update(payload_bytes)
+    return h.digest()
+
+
+def chain_hash_bytes(
+    prev_hex: Optional[str],
+    payload_bytes: bytes,
+    *,
+    alg: str = "sha256",
+    domain: bytes = DOMAIN,
+) -> str:
+    """
+    Same as chain_hash, for a payload already rendered with canonical_json_bytes.
+    Lets callers that also sign or write the canonical form serialize it only once.
+    """
+    prev_digest = None
+    if prev_hex:
+        try:
+            prev_digest = bytes.fromhex(prev_hex)
+        except ValueError as e:
+            raise ValueError("prev_hex must be a valid hex digest") from e
+
+    return chain_digest(prev_digest, payload_bytes, alg=alg, domain=domain).hex()
+
+
 def chain_hash(
     prev_hex: Optional[str],
     payload: Dict[str, Any],
@@ -84,23 +147,13 @@ def chain_hash(
     - alg: 'sha256' (default) or 'blake2b'
     - returns hex digest string
     """
-    h = _new_hasher(alg)
-    h.update(domain)
-
-    if prev_hex:
-        try:
-            h.update(bytes.fromhex(prev_hex))
-        except ValueError as e:
-            raise ValueError("prev_hex must be a valid hex digest") from e
-
     try:
-        cj = canonical_json(payload)
+        cj = canonical_json_bytes(payload)
     except ValueError as e:
         # Raised if payload contains NaN/Infinity
         raise ValueError(f"Payload is not JSON-canonicalizable: {e}") from e
 
-    h.update(cj.encode("utf-8"))
-    return h.hexdigest()
+    return chain_hash_bytes(prev_hex, cj, alg=alg, domain=domain)
 
 
 def make_record(
@@ -203,7 +256,10 @@ def verify_chain(
 
 __all__ = [
     "canonical_json",
+    "canonical_json_bytes",
     "chain_hash",
+    "chain_hash_bytes",
+    "chain_digest",
     "make_record",
     "verify_link",
     "verify_chain",
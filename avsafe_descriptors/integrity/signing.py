@@ -21,7 +21,9 @@ Env:
 """
 
 from __future__ import annotations
-from typing import Optional, Tuple
+from functools import lru_cache
+from concurrent.futures import Executor
+from typing import Callable, List, Optional, Sequence, Tuple
 import os, hashlib
 
 # Optional backends (lazy-checked)
@@ -58,6 +60,16 @@ def _coerce_seed(seed_hex: str) -> bytes:
         return raw[:32]
     raise ValueError("private_key_hex must be 32 or 64 bytes (64 or 128 hex chars)")
 
+@lru_cache(maxsize=8)
+def _demo_prefix(secret: bytes):
+    # sha256 state after absorbing the secret; copied per message so the prefix is compressed once
+    return hashlib.sha256(secret)
+
+def _demo_mac(secret: bytes, data: bytes) -> str:
+    h = _demo_prefix(secret).copy()
+    h.update(data)  # no secret+data concatenation copy for large payloads
+    return h.hexdigest()
+
 def _sign_nacl(data: bytes, priv_seed_hex: Optional[str]) -> Tuple[str, str]:
     if priv_seed_hex is None:
         sk = NaClSigningKey.generate()
@@ -100,9 +112,42 @@ def sign_bytes(data: bytes, private_key_hex: Optional[str] = None) -> dict:
 
     # LAST-RESORT FALLBACK (NOT CRYPTOGRAPHIC): still lets the simulator run.
     secret = (seed_hex or "demo-secret").encode("utf-8")
-    sig = hashlib.sha256(secret + data).hexdigest()
+    sig = _demo_mac(secret, data)
     return {"scheme": "sha256-demo", "signature_hex": sig, "public_key_hex": None}
 
+def _batch_signer(seed_hex: Optional[str]) -> Tuple[str, Optional[str], Callable[[bytes], str]]:
+    """(scheme, public_key_hex, sign(data) -> signature_hex) with the key built once."""
+    if _HAVE_NACL:
+        nsk = NaClSigningKey.generate() if seed_hex is None else NaClSigningKey(_coerce_seed(seed_hex))
+        return "ed25519", nsk.verify_key.encode().hex(), lambda d: nsk.sign(d).signature.hex()
+
+    if _HAVE_CRYPTO:
+        csk = Ed25519PrivateKey.generate() if seed_hex is None else Ed25519PrivateKey.from_private_bytes(_coerce_seed(seed_hex))
+        pub_hex = csk.public_key().public_bytes(Encoding.Raw, PublicFormat.Raw).hex()
+        return "ed25519", pub_hex, lambda d: csk.sign(d).hex()
+
+    if _strict_crypto():
+        raise RuntimeError("Real crypto required (set libsodium/PyNaCl or cryptography).")
+
+    secret = (seed_hex or "demo-secret").encode("utf-8")
+    return "sha256-demo", None, lambda d: _demo_mac(secret, d)
+
+def sign_many(
+    datas: Sequence[bytes],
+    private_key_hex: Optional[str] = None,
+    *,
+    executor: Optional[Executor] = None,
+) -> List[dict]:
+    """
+    sign_bytes for a batch, same result dicts in the same order. The key is resolved
+    and derived once for the batch (so one ephemeral key covers it when none is
+    configured). With an executor, messages are signed concurrently; both Ed25519
+    backends release the GIL while signing.
+    """
+    scheme, pub_hex, sign = _batch_signer(private_key_hex or _env_seed_hex())
+    sigs = executor.map(sign, datas) if executor is not None else map(sign, datas)
+    return [{"scheme": scheme, "signature_hex": sig, "public_key_hex": pub_hex} for sig in sigs]
+
 def verify_bytes(data: bytes, signature_hex: str, public_key_hex: Optional[str], scheme: str = "ed25519") -> bool:
     """
     Verify signature over bytes. Returns True/False.
@@ -127,7 +172,7 @@ def verify_bytes(data: bytes, signature_hex: str, public_key_hex: Optional[str],
         return False
 
     if scheme == "sha256-demo":
-        return hashlib.sha256(b"demo-secret" + data).hexdigest() == signature_hex
+        return _demo_mac(b"demo-secret", data) == signature_hex
 
     return False
 
@@ -137,4 +182,4 @@ def sign_payload(payload: dict, private_key_hex: Optional[str] = None) -> dict:
     msg = SIGN_DOMAIN + canonical_json(payload).encode("utf-8")
     return sign_bytes(msg, private_key_hex)
 
-__all__ = ["sign_bytes", "verify_bytes", "sign_payload", "SIGN_DOMAIN"]
+__all__ = ["sign_bytes", "sign_many", "verify_bytes", "sign_payload", "SIGN_DOMAIN"]
@@ -4,12 +4,23 @@ from __future__ import annotations
 import io
 import os
 import json
+import math
 import gzip
 import tempfile
 from pathlib import Path
 from typing import Iterable, Iterator, Callable, Optional, Union, TextIO, Any, Literal
 
+try:  # optional C-accelerated parser (pip install .[speedups])
+    import orjson  # type: ignore
+    _HAVE_ORJSON = True
+except Exception:
+    _HAVE_ORJSON = False
+
 PathLike = Union[str, os.PathLike[str]]
+
+# write_jsonl joins this many lines per write() into a buffer of _WRITE_BUFFER bytes
+_WRITE_GROUP = 1024
+_WRITE_BUFFER = 1 << 20
 OnError = Literal["raise", "skip"]
 
 __all__ = [
@@ -17,9 +28,57 @@ __all__ = [
     "append_jsonl",
     "read_jsonl",
     "iter_jsonl",
+    "loads_line",
+    "dumps_line",
 ]
 
 
+def loads_line(line: Union[str, bytes]) -> Any:
+    """
+    Parse one JSON document (a JSONL line, str or bytes), via orjson when installed.
+    Input orjson rejects but stdlib json accepts (e.g. NaN/Infinity) falls back to json.
+    """
+    if _HAVE_ORJSON:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(line)
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """True if a NaN/Infinity float appears anywhere in obj (dict values, list items)."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(v) for v in obj)
+    return False
+
+
+def dumps_line(obj: Any, *, indent: int = 0) -> bytes:
+    """
+    Serialize one record to UTF-8 JSON bytes (no trailing newline), via orjson when installed.
+
+    Output is compact unless indent > 0 (orjson handles indent=2 natively; other
+    widths use stdlib json). Non-string keys are stringified. Non-finite floats are
+    written as NaN/Infinity, as json.dumps does (orjson would write null).
+    """
+    if _HAVE_ORJSON and indent in (0, 2):
+        opts = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            out = orjson.dumps(obj, option=opts)
+        except orjson.JSONEncodeError:
+            out = None  # e.g. unsupported types or >64-bit ints: let json decide
+        # Only a null in the output can be a non-finite float, so most records skip the walk
+        if out is not None and (b"null" not in out or not _has_non_finite(obj)):
+            return out
+    if indent > 0:
+        return json.dumps(obj, ensure_ascii=False, indent=indent).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
 def _ensure_parent(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -61,10 +120,40 @@ def _open_for_write_atomic(
         # tmp is already a text fp in this branch
         # but NamedTemporaryFile(...) returned a file handle; ensure newline/encoding by reopening
         tmp.close()
-        text_fp = open(tmp_path, "w", encoding=encoding, newline=newline)
+        text_fp = open(tmp_path, "w", encoding=encoding, newline=newline, buffering=_WRITE_BUFFER)
         return text_fp, tmp_path
 
 
+def _write_records(
+    fp: TextIO,
+    records: Iterable[dict[str, Any]],
+    *,
+    ensure_ascii: bool,
+    sort_keys: bool,
+) -> int:
+    """
+    Serialize records one per line and write them in groups of _WRITE_GROUP lines
+    (one joined write per group instead of two per record). Returns the count.
+    """
+    dumps = json.JSONEncoder(ensure_ascii=ensure_ascii, sort_keys=sort_keys).encode
+    count = 0
+    group: list[str] = []
+    for rec in records:
+        if not isinstance(rec, dict):
+            # Keep what was serialized so far, as the per-record writes did
+            if group:
+                fp.write("\n".join(group) + "\n")
+            raise TypeError(f"Each record must be dict, got {type(rec)!r}")
+        group.append(dumps(rec))
+        count += 1
+        if len(group) >= _WRITE_GROUP:
+            fp.write("\n".join(group) + "\n")
+            group.clear()
+    if group:
+        fp.write("\n".join(group) + "\n")
+    return count
+
+
 def _should_gzip(path: Path, gzip_flag: Optional[bool]) -> bool:
     if gzip_flag is not None:
         return bool(gzip_flag)
@@ -103,50 +192,23 @@ def write_jsonl(
             # Instead, we throw if append+gzip to avoid corrupting archives.
             raise ValueError("append=True is not supported for gzip files; write a new .gz instead.")
         _ensure_parent(target)
-        with open(target, "a", encoding="utf-8", newline="\n") as f:
-            count = 0
-            for rec in records:
-                if not isinstance(rec, dict):
-                    raise TypeError(f"Each record must be dict, got {type(rec)!r}")
-                f.write(json.dumps(rec, ensure_ascii=ensure_ascii, sort_keys=sort_keys))
-                f.write("\n")
-                count += 1
-        return count
+        with open(target, "a", encoding="utf-8", newline="\n", buffering=_WRITE_BUFFER) as f:
+            return _write_records(f, records, ensure_ascii=ensure_ascii, sort_keys=sort_keys)
 
     if not atomic:
         # Non-atomic, overwrite
         if gz:
             with gzip.open(target, "wt", encoding="utf-8", newline="\n") as f:
-                count = 0
-                for rec in records:
-                    if not isinstance(rec, dict):
-                        raise TypeError(f"Each record must be dict, got {type(rec)!r}")
-                    f.write(json.dumps(rec, ensure_ascii=ensure_ascii, sort_keys=sort_keys))
-                    f.write("\n")
-                    count += 1
-                return count
+                return _write_records(f, records, ensure_ascii=ensure_ascii, sort_keys=sort_keys)
         else:
             _ensure_parent(target)
-            with open(target, "w", encoding="utf-8", newline="\n") as f:
-                count = 0
-                for rec in records:
-                    if not isinstance(rec, dict):
-                        raise TypeError(f"Each record must be dict, got {type(rec)!r}")
-                    f.write(json.dumps(rec, ensure_ascii=ensure_ascii, sort_keys=sort_keys))
-                    f.write("\n")
-                    count += 1
-                return count
+            with open(target, "w", encoding="utf-8", newline="\n", buffering=_WRITE_BUFFER) as f:
+                return _write_records(f, records, ensure_ascii=ensure_ascii, sort_keys=sort_keys)
 
     # Atomic path
     fp, tmp_path = _open_for_write_atomic(target, gzip_enabled=gz, encoding="utf-8", newline="\n")
     try:
-        count = 0
-        for rec in records:
-            if not isinstance(rec, dict):
-                raise TypeError(f"Each record must be dict, got {type(rec)!r}")
-            fp.write(json.dumps(rec, ensure_ascii=ensure_ascii, sort_keys=sort_keys))
-            fp.write("\n")
-            count += 1
+        count = _write_records(fp, records, ensure_ascii=ensure_ascii, sort_keys=sort_keys)
         fp.flush()
         # Ensure bytes hit disk (temp file descriptor may be nested)
         try:
@@ -224,7 +286,7 @@ def iter_jsonl(
         if not line or line.startswith("#"):
             continue
         try:
-            obj = json.loads(line)
+            obj = loads_line(line)
             if not isinstance(obj, dict):
                 raise TypeError(f"Line {line_no}: JSON value must be an object (dict), got {type(obj)!r}")
             if validate is not None:
@@ -2,11 +2,15 @@
 from __future__ import annotations
 
 import json
+import threading
+from itertools import islice
 from pathlib import Path
 from typing import Iterable, Iterator, Literal, Mapping, Optional, Sequence, Union
 
-from sqlalchemy import create_engine, text
-from sqlalchemy.engine import Engine
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Connection, Engine
+
+from .jsonl_io import dumps_line, loads_line
 
 PathLike = Union[str, Path]
 ConflictMode = Literal["insert", "ignore", "replace"]
@@ -15,26 +19,71 @@ OnError = Literal["raise", "skip"]
 __all__ = [
     "ensure_schema",
     "ingest",
+    "ingest_batch",
     "list_sessions",
     "session_summary",
     "query_minutes",
+    "iter_minutes_jsonl",
+    "dump_minutes_jsonl",
     "delete_session",
     "open_engine",
 ]
 
 
+# Per-connection PRAGMAs, applied by a "connect" listener so every pooled connection
+# gets them (not just the first). mmap_size is advisory; SQLite caps it at its build limit.
+_CONNECT_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=1073741824",
+    "PRAGMA cache_size=-65536",  # 64 MiB page cache (negative = KiB)
+)
+
+# One engine (and connection pool) per database file, shared across calls. The pool
+# keeps _POOL_SIZE connections open (so their statement caches stay warm); bursts
+# beyond that get short-lived overflow connections.
+_POOL_SIZE = 8
+_POOL_OVERFLOW = 32
+_ENGINES: dict[str, Engine] = {}
+_ENGINES_LOCK = threading.Lock()
+
+
+def _on_connect(dbapi_cx, _record) -> None:
+    cur = dbapi_cx.cursor()
+    try:
+        for pragma in _CONNECT_PRAGMAS:
+            cur.execute(pragma)
+    finally:
+        cur.close()
+
+
 def open_engine(db_path: PathLike) -> Engine:
     """
-    Create a SQLAlchemy engine for an on-disk SQLite database.
-    Uses WAL mode and pre-ping for resilience.
+    Return the shared SQLAlchemy engine for an on-disk SQLite database.
+
+    Engines are created once per resolved path and reused, so callers pay for
+    dialect setup and pool creation only on first use. Every new connection is
+    switched to WAL with synchronous=NORMAL, in-memory temp storage, mmap I/O and
+    a 64 MiB page cache.
     """
-    db_uri = f"sqlite:///{Path(db_path)}"
-    eng = create_engine(db_uri, future=True, pool_pre_ping=True)
-    # Set pragmatic defaults each time we connect
-    with eng.begin() as cx:
-        cx.execute(text("PRAGMA journal_mode=WAL"))
-        cx.execute(text("PRAGMA synchronous=NORMAL"))
-        cx.execute(text("PRAGMA foreign_keys=ON"))
+    key = str(Path(db_path).resolve())
+    eng = _ENGINES.get(key)
+    if eng is not None:
+        return eng
+    with _ENGINES_LOCK:
+        eng = _ENGINES.get(key)
+        if eng is None:
+            eng = create_engine(
+                f"sqlite:///{key}",
+                future=True,
+                connect_args={"check_same_thread": False},
+                pool_size=_POOL_SIZE,
+                max_overflow=_POOL_OVERFLOW,
+            )
+            event.listen(eng, "connect", _on_connect)
+            _ENGINES[key] = eng
     return eng
 
 
@@ -42,9 +91,12 @@ def ensure_schema(db_path: PathLike) -> None:
     """
     Create tables and indices if they do not exist.
     Tries SQLite STRICT tables when available; falls back otherwise.
+    Connection PRAGMAs (WAL, mmap, cache size, ...) come from open_engine().
     """
     eng = open_engine(db_path)
     with eng.begin() as cx:
+        # Measurement columns stay REAL (not scaled INTEGER): chain hashes and signatures
+        # cover the exact float values, and flicker_index etc. carry more than 0.1 precision.
         # Try STRICT table (SQLite >= 3.37). If it fails, create a non-STRICT table.
         try:
             cx.execute(text("""
@@ -84,7 +136,8 @@ def ensure_schema(db_path: PathLike) -> None:
                     PRIMARY KEY (session, idx)
                 )
             """))
-        # Helpful indices (PRIMARY KEY already covers session+idx)
+        # Helpful indices. The PRIMARY KEY already covers (session, idx), so the
+        # "WHERE session = ? ORDER BY idx" minute scans walk it without a sort step.
         cx.execute(text("CREATE INDEX IF NOT EXISTS ix_minutes_session_ts ON minutes(session, ts)"))
         cx.execute(text("CREATE INDEX IF NOT EXISTS ix_minutes_session_chain ON minutes(session, chain_hash)"))
 
@@ -117,6 +170,51 @@ def _convert_record(session: str, r: Mapping) -> dict:
         raise ValueError(f"Record missing required key: {e!s}") from e
 
 
+_INSERT_VERB = {
+    "insert": "INSERT",
+    "ignore": "INSERT OR IGNORE",
+    "replace": "INSERT OR REPLACE",
+}
+
+
+def _insert_stmt(conflict: ConflictMode):
+    return text(f"""
+        {_INSERT_VERB[conflict]} INTO minutes
+        (session, idx, ts, laeq, lcpeak, tlm_freq_hz, tlm_mod_percent, flicker_index,
+         third_oct, chain_hash, signature_hex, scheme, public_key_hex)
+        VALUES
+        (:session, :idx, :ts, :laeq, :lcpeak, :tlm_freq_hz, :tlm_mod_percent, :flicker_index,
+         :third_oct, :chain_hash, :signature_hex, :scheme, :public_key_hex)
+    """)
+
+
+def ingest_batch(
+    cx: Connection,
+    session: str,
+    records: Iterable[Mapping],
+    *,
+    conflict: ConflictMode = "replace",
+    on_error: OnError = "raise",
+) -> int:
+    """
+    Insert one batch of records on an open connection with a single executemany.
+
+    The caller owns the transaction (e.g. ``with eng.begin() as cx:``), so any number
+    of batches can share one BEGIN/COMMIT. Returns the number of rows sent.
+    """
+    rows: list[dict] = []
+    for r in records:
+        try:
+            rows.append(_convert_record(session, r))
+        except ValueError:
+            if on_error == "skip":
+                continue
+            raise
+    if rows:
+        cx.execute(_insert_stmt(conflict), rows)  # executemany
+    return len(rows)
+
+
 def ingest(
     db_path: PathLike,
     session: str,
@@ -124,7 +222,7 @@ def ingest(
     *,
     conflict: ConflictMode = "replace",
     on_error: OnError = "raise",
-    chunk_size: int = 1000,
+    chunk_size: int = 10_000,
 ) -> int:
     """
     Ingest minute-summary records into SQLite.
@@ -134,49 +232,27 @@ def ingest(
         - "ignore": INSERT OR IGNORE (skip duplicates)
         - "replace": INSERT OR REPLACE (upsert)  [default]
     - on_error: "raise" or "skip" malformed records
-    - chunk_size: batch size for executemany
+    - chunk_size: batch size for executemany (one transaction per batch)
 
     Returns number of rows written (for 'ignore', this is attempted rows; skipped duplicates are not counted by SQLite).
     """
-    verb = {
-        "insert": "INSERT",
-        "ignore": "INSERT OR IGNORE",
-        "replace": "INSERT OR REPLACE",
-    }[conflict]
-
-    stmt = text(f"""
-        {verb} INTO minutes
-        (session, idx, ts, laeq, lcpeak, tlm_freq_hz, tlm_mod_percent, flicker_index,
-         third_oct, chain_hash, signature_hex, scheme, public_key_hex)
-        VALUES
-        (:session, :idx, :ts, :laeq, :lcpeak, :tlm_freq_hz, :tlm_mod_percent, :flicker_index,
-         :third_oct, :chain_hash, :signature_hex, :scheme, :public_key_hex)
-    """)
-
     eng = open_engine(db_path)
     total = 0
-    batch: list[dict] = []
+    batch: list[Mapping] = []
 
-    def flush_batch(engine: Engine, items: list[dict]) -> int:
+    def flush_batch(items: list[Mapping]) -> int:
         if not items:
             return 0
-        with engine.begin() as cx:
-            cx.execute(stmt, items)  # executemany
-        return len(items)
+        with eng.begin() as cx:
+            return ingest_batch(cx, session, items, conflict=conflict, on_error=on_error)
 
     for r in records:
-        try:
-            row = _convert_record(session, r)
-        except ValueError:
-            if on_error == "skip":
-                continue
-            raise
-        batch.append(row)
+        batch.append(r)
         if len(batch) >= chunk_size:
-            total += flush_batch(eng, batch)
+            total += flush_batch(batch)
             batch.clear()
 
-    total += flush_batch(eng, batch)
+    total += flush_batch(batch)
     return total
 
 
@@ -266,6 +342,106 @@ def query_minutes(
     return out
 
 
+# Minute columns in idx order; iter_minutes_jsonl() shapes each row like the ingest
+# records and serializes it in Python, so REAL values keep full float precision
+_MINUTE_COLS_SQL = """
+    SELECT idx, ts, laeq, lcpeak, third_oct,
+           tlm_freq_hz, tlm_mod_percent, flicker_index,
+           chain_hash, signature_hex, scheme, public_key_hex
+    FROM minutes
+    WHERE session = :session
+    ORDER BY idx ASC
+"""
+
+
+def iter_minutes_jsonl(
+    db_path: PathLike,
+    session: str,
+    *,
+    limit: Optional[int] = None,
+    batch_size: int = 10_000,
+) -> Iterator[str]:
+    """
+    Stream a session's minutes as JSONL lines (without trailing newline), in idx order.
+
+    Rows are fetched as plain sqlite3 tuples in batches of `batch_size` and serialized
+    with dumps_line(), so REAL columns keep their full repr and the chain hashes
+    still verify on the dumped file.
+    """
+    sql = _MINUTE_COLS_SQL.strip()
+    params: dict[str, object] = {"session": session}
+    if limit is not None:
+        sql += "\n    LIMIT :limit"
+        params["limit"] = int(limit)
+
+    # Plain sqlite3 cursor on a pooled connection: skips SQLAlchemy's per-row
+    # Row wrapping while keeping the pool and the connect-time PRAGMAs.
+    raw = open_engine(db_path).raw_connection()
+    try:
+        cur = raw.driver_connection.execute(sql, params)
+        try:
+            while True:
+                rows = cur.fetchmany(batch_size)
+                if not rows:
+                    break
+                for (idx, ts, laeq, lcpeak, third_oct, tlm_f, tlm_m, fi,
+                     chash, sig, scheme, pk) in rows:
+                    rec = {
+                        "idx": idx,
+                        "ts": ts,
+                        "audio": {
+                            "laeq_db": laeq,
+                            "lcpeak_db": lcpeak,
+                            "third_octave_db": loads_line(third_oct) if third_oct else {},
+                        },
+                        "light": {
+                            "tlm_freq_hz": tlm_f,
+                            "tlm_mod_percent": tlm_m,
+                            "flicker_index": fi,
+                        },
+                        "chain": {
+                            "hash": chash,
+                            "signature_hex": sig,
+                            "scheme": scheme,
+                            "public_key_hex": pk,
+                        },
+                    }
+                    yield dumps_line(rec).decode("utf-8")
+        finally:
+            cur.close()
+    finally:
+        raw.close()  # returns the connection to the pool
+
+
+# Lines per joined write in dump_minutes_jsonl()
+_WRITE_GROUP = 65_536
+
+
+def dump_minutes_jsonl(
+    db_path: PathLike,
+    session: str,
+    out_path: PathLike,
+    *,
+    limit: Optional[int] = None,
+) -> int:
+    """
+    Write a session's minutes (idx order) to a JSONL file; returns the row count.
+
+    Lines come from iter_minutes_jsonl() and are written in joined groups of 64k
+    rather than one write() per minute.
+    """
+    n = 0
+    lines = iter_minutes_jsonl(db_path, session, limit=limit)
+    with open(out_path, "w", encoding="utf-8") as f:
+        while True:
+            chunk = list(islice(lines, _WRITE_GROUP))
+            if not chunk:
+                break
+            f.write("\n".join(chunk) + "\n")
+            n += len(chunk)
+    return n
+
+
 def delete_session(db_path: PathLike, session: str) -> int:
     """Delete all rows for a session. Returns number of rows deleted."""
     eng = open_engine(db_path)
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 from dataclasses import dataclass, asdict
+from functools import lru_cache
 from typing import Dict, Iterable, Generator, Optional, Tuple
 import math
 import numpy as np
@@ -27,18 +28,25 @@ def _percent_modulation(x: np.ndarray) -> float:
     return (x_max - x_min) / denom * 100.0
 
 
-def _flicker_index(x: np.ndarray, fs: float, f_hint: Optional[float]) -> float:
+def _flicker_index(
+    x: np.ndarray,
+    fs: float,
+    f_hint: Optional[float],
+    f_dom: Optional[float] = None,
+) -> float:
     """
     Flicker Index (dimensionless). Approximated per one dominant-cycle segment:
       FI = (Area above mean over one period) / (Total area under curve over one period)
     If we can't robustly segment by cycle, fall back to whole-window approximation.
+    `f_dom` is the dominant frequency of the clipped window when the caller already has it.
     """
     # Ensure strictly positive (illum) for area computation
     x = np.asarray(x, dtype=float)
     x = np.maximum(x, 0.0)
 
     # Try to infer a fundamental frequency for a single-cycle slice
-    f_dom = _dominant_frequency(x, fs, mains_hint=f_hint)
+    if f_dom is None:
+        f_dom = _dominant_frequency(x, fs, mains_hint=f_hint)
     if not math.isfinite(f_dom) or f_dom <= 0.0:
         # Whole-window approximation
         mean = float(np.mean(x)) if x.size else 0.0
@@ -72,6 +80,37 @@ def _flicker_index(x: np.ndarray, fs: float, f_hint: Optional[float]) -> float:
     return (area_above / area_total) if area_total > 0 else 0.0
 
 
+@lru_cache(maxsize=16)
+def _fft_plan(size: int, fs: float, mains_hint: Optional[float]):
+    """
+    Everything _dominant_frequency needs that depends only on the window length,
+    fs and mains hint: the padded FFT length, bin frequencies, the first bin at or
+    above 2 Hz, and the (f0, i0, i1) search bands around mains harmonics.
+    Windows within a run share all of these, so they are computed once.
+    """
+    # Zero-pad for resolution
+    n = int(1 << (int(np.ceil(np.log2(size))) + 1))
+    freqs = np.fft.rfftfreq(n, d=1.0 / fs)
+    freqs.setflags(write=False)
+    n_bins = freqs.size
+
+    # Ignore DC and very low bins (< 2 Hz)
+    lo = int(np.searchsorted(freqs, 2.0, side="left"))
+
+    bands: Tuple[Tuple[float, int, int], ...] = ()
+    if mains_hint in (50.0, 60.0):
+        # Candidate bands near 100/120 Hz and a few harmonics
+        cands = []
+        for k in (2, 3, 4, 5):  # multiples of mains (e.g., 2*50=100 Hz)
+            f0 = mains_hint * k
+            bw = max(2.0, f0 * 0.05)  # ±5% or 2 Hz min
+            i0 = max(lo, int(np.searchsorted(freqs, f0 - bw)))
+            i1 = min(n_bins - 1, int(np.searchsorted(freqs, f0 + bw)))
+            cands.append((f0, i0, i1))
+        bands = tuple(cands)
+    return n, freqs, lo, bands
+
+
 def _dominant_frequency(x: np.ndarray, fs: float, mains_hint: Optional[float]) -> float:
     """
     Estimate dominant flicker frequency via FFT peak (excluding DC).
@@ -82,33 +121,21 @@ def _dominant_frequency(x: np.ndarray, fs: float, mains_hint: Optional[float]) -
     if x.size < 8 or fs <= 0:
         return float("nan")
 
+    n, freqs, lo, bands = _fft_plan(x.size, float(fs), mains_hint)
+
     # Remove DC and slow trend
     x = x - np.mean(x)
-    # Zero-pad for resolution
-    n = int(1 << (int(np.ceil(np.log2(x.size))) + 1))
     spec = np.fft.rfft(x, n=n)
-    freqs = np.fft.rfftfreq(n, d=1.0 / fs)
     mags = np.abs(spec)
 
-    # Ignore DC and very low bins (< 2 Hz)
-    lo = np.searchsorted(freqs, 2.0, side="left")
     if lo >= mags.size:
         return float("nan")
 
-    if mains_hint in (50.0, 60.0):
-        # Candidate bands near 100/120 Hz and a few harmonics
-        cands: Dict[float, Tuple[int, int]] = {}
-        for k in (2, 3, 4, 5):  # multiples of mains (e.g., 2*50=100 Hz)
-            f0 = mains_hint * k
-            bw = max(2.0, f0 * 0.05)  # ±5% or 2 Hz min
-            i0 = max(lo, np.searchsorted(freqs, f0 - bw))
-            i1 = min(mags.size - 1, np.searchsorted(freqs, f0 + bw))
-            cands[f0] = (i0, i1)
-
+    if bands:
         # Pick the band with max magnitude
         best_f = float("nan")
         best_mag = -1.0
-        for f0, (i0, i1) in cands.items():
+        for f0, i0, i1 in bands:
             if i1 <= i0:
                 continue
             j = i0 + int(np.argmax(mags[i0:i1]))
@@ -153,7 +180,7 @@ def tlm_metrics(
 
     f_dom = _dominant_frequency(x, fs, mains_hint)
     pm = _percent_modulation(x)
-    fi = _flicker_index(x, fs, mains_hint)
+    fi = _flicker_index(x, fs, mains_hint, f_dom)  # x is already clipped: same FFT, done once
 
     # Boundaries
     if not math.isfinite(pm) or pm < 0:
@@ -202,6 +229,12 @@ class MinuteAggregator:
     def __post_init__(self):
         self._f, self._pm, self._fi = [], [], []
 
+    def reset(self) -> None:
+        """Drop collected metrics so the aggregator can be reused for the next minute."""
+        self._f.clear()
+        self._pm.clear()
+        self._fi.clear()
+
     def add(self, metrics: Dict[str, float]) -> None:
         f = metrics.get("f_flicker_Hz", float("nan"))
         pm = metrics.get("pct_mod", float("nan"))
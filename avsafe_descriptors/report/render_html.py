@@ -9,7 +9,7 @@ from typing import Dict, Any, List, Tuple
 from jinja2 import Environment, Template, select_autoescape
 
 # Chain & canonicalization
-from ..integrity.hash_chain import chain_hash, canonical_json
+from ..integrity.hash_chain import chain_hash_bytes, canonical_json_bytes
 
 # Optional Ed25519 verification (PyNaCl)
 try:
@@ -325,11 +325,12 @@ def _verify_chain_and_signatures(minutes: List[Dict[str, Any]]) -> Dict[str, Any
         chain = rec.get("chain", {}) or {}
         rec_hash = chain.get("hash")
 
-        # Chain check
+        # Chain check (canonical bytes are built once and reused for the signature)
         try:
-            computed = chain_hash(prev_hash, payload)
+            cj = canonical_json_bytes(payload)
+            computed = chain_hash_bytes(prev_hash, cj)
         except Exception:
-            computed = None
+            cj = computed = None
 
         if not rec_hash or not computed or rec_hash != computed:
             chain_ok = False
@@ -354,14 +355,16 @@ def _verify_chain_and_signatures(minutes: List[Dict[str, Any]]) -> Dict[str, Any
             try:
                 vk = VerifyKey(bytes.fromhex(pk_hex))
                 sig = bytes.fromhex(sig_hex)
-                msg_dom = b"avsafe:sign:v1" + canonical_json(payload).encode("utf-8")
+                if cj is None:
+                    raise ValueError("payload not canonicalizable")
+                msg_dom = b"avsafe:sign:v1" + cj
                 ok = False
                 try:
                     vk.verify(msg_dom, sig)
                     ok = True
                 except Exception:
                     # Back-compat: raw payload
-                    vk.verify(canonical_json(payload).encode("utf-8"), sig)
+                    vk.verify(cj, sig)
                     ok = True
                 if ok:
                     sig_valid += 1
@@ -415,7 +418,21 @@ def render(
     footnote: str | None = None,
 ) -> None:
     """
-    Render an HTML audit report with verification (chain & signatures).
+    Render an HTML audit report with verification (chain & signatures) to `out_html`.
+    """
+    html = render_to_string(minutes_path, results_path, max_rows=max_rows, footnote=footnote)
+    pathlib.Path(out_html).write_text(html, encoding="utf-8")
+
+
+def render_to_string(
+    minutes_path: str,
+    results_path: str,
+    *,
+    max_rows: int = 200,
+    footnote: str | None = None,
+) -> str:
+    """
+    Same report as render(), returned as a string (for HTTP responses / stdout).
     """
     # Read (1) capped head for table, (2) full list for verification
     table_minutes, total, skipped = _read_head_minutes(minutes_path, cap=max_rows)
@@ -428,6 +445,18 @@ def render(
     except Exception:
         results_obj = {}
 
+    return _render_html(table_minutes, total, skipped, all_minutes, results_obj, max_rows, footnote)
+
+
+def _render_html(
+    table_minutes: List[dict],
+    total: int,
+    skipped: int,
+    all_minutes: List[dict],
+    results_obj: Dict[str, Any],
+    max_rows: int,
+    footnote: str | None,
+) -> str:
     # Summaries + verification
     summary, integrity = _summarize_minutes(table_minutes, total)
     coerced = _coerce_results(results_obj)
@@ -440,7 +469,7 @@ def render(
 
     now_iso = datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
 
-    html = TEMPLATE.render(
+    return TEMPLATE.render(
         now_iso=now_iso,
         summary=summary,
         integrity=integrity,
@@ -453,4 +482,11 @@ def render(
         table_cap=max_rows,
         footnote=footnote or (f"{skipped} malformed line(s) skipped during parsing." if skipped else None),
     )
-    pathlib.Path(out_html).write_text(html, encoding="utf-8")
+
+
+def warmup() -> None:
+    """
+    Render one empty report so the first real render (first /report request or CLI
+    run) does not pay for Jinja's first-render setup and the verification path.
+    """
+    _render_html([], 0, 0, [], {}, 200, None)
@@ -1,13 +1,22 @@
 # avsafe_descriptors/rules/evaluator.py
 from __future__ import annotations
 
-import json
 import math
-import statistics
-from typing import Dict, Iterable, List, Mapping, Optional, Tuple, Union, Any
+from array import array
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union, Any
 
+import numpy as np
+
+from ..io.jsonl_io import loads_line
 from .profile_loader import RulesProfile  # your loader’s return type (dataclass or dict-like)
-from .ieee_1789 import allowed_mod_percent
+from .ieee_1789 import allowed_mod_percent_many
+
+# Optional multi-core reductions for very long sessions (pip install .[speedups])
+try:
+    from numba import njit, prange  # type: ignore
+    _HAVE_NUMBA = True
+except Exception:
+    _HAVE_NUMBA = False
 
 
 ProfileLike = Union[RulesProfile, Mapping[str, Any]]
@@ -64,18 +73,18 @@ def _normalize_locale(raw_locale: Optional[str], profile: ProfileLike) -> Option
     return token  # return normalized token; caller can still fall back to default
 
 
-def _percentile(values: List[float], p: float) -> Optional[float]:
+def _percentile(values: Sequence[float] | np.ndarray, p: float) -> Optional[float]:
     """
-    Compute the p-th percentile (0–100) using linear interpolation (no NumPy dependency).
-    Returns None if the list is empty.
+    Compute the p-th percentile (0–100) using linear interpolation.
+    Returns None if there are no values.
     """
-    if not values:
+    if len(values) == 0:
         return None
+    xs = np.sort(np.asarray(values, dtype=np.float64))
     if p <= 0:
-        return min(values)
+        return float(xs[0])
     if p >= 100:
-        return max(values)
-    xs = sorted(values)
+        return float(xs[-1])
     k = (len(xs) - 1) * (p / 100.0)
     f = math.floor(k)
     c = math.ceil(k)
@@ -84,26 +93,84 @@ def _percentile(values: List[float], p: float) -> Optional[float]:
     return float(xs[f] + (xs[c] - xs[f]) * (k - f))
 
 
-def _collect_minutes(minutes_path: str) -> List[dict]:
+# Below this many minutes a single NumPy pass beats spinning up worker threads
+_PARALLEL_MIN_MINUTES = 200_000
+
+if _HAVE_NUMBA:
+    @njit(parallel=True)
+    def _sum_and_count_over_par(x, limit):  # pragma: no cover - needs numba
+        total = 0.0
+        over = 0
+        for i in prange(x.shape[0]):
+            total += x[i]
+            if x[i] > limit:
+                over += 1
+        return total, over
+
+    @njit(parallel=True)
+    def _count_exceeding_par(x, bound):  # pragma: no cover - needs numba
+        n = 0
+        for i in prange(x.shape[0]):
+            if x[i] > bound[i]:
+                n += 1
+        return n
+
+
+def _sum_and_count_over(x: np.ndarray, limit: float) -> Tuple[float, int]:
+    """(sum(x), count(x > limit)) — Numba prange for very long sessions, NumPy otherwise."""
+    if _HAVE_NUMBA and x.size >= _PARALLEL_MIN_MINUTES:
+        total, over = _sum_and_count_over_par(x, limit)
+        return float(total), int(over)
+    return float(x.sum()), int(np.count_nonzero(x > limit))
+
+
+def _count_exceeding(x: np.ndarray, bound: np.ndarray) -> int:
+    """count(x > bound), elementwise."""
+    if _HAVE_NUMBA and x.size >= _PARALLEL_MIN_MINUTES:
+        return int(_count_exceeding_par(x, bound))
+    return int(np.count_nonzero(x > bound))
+
+
+class _MinuteColumns(NamedTuple):
+    n: int
+    laeq: np.ndarray      # audio.laeq_db, where numeric
+    tlm_freq: np.ndarray  # light.tlm_freq_hz, where freq and mod are both numeric
+    tlm_mod: np.ndarray   # light.tlm_mod_percent, paired with tlm_freq
+
+
+def _collect_minutes(minutes_path: str) -> _MinuteColumns:
     """
-    Load JSONL minutes file into a list of dicts (ignore blank lines).
+    Stream a JSONL minutes file into the numeric columns the evaluator needs
+    (ignore blank lines). Records are not retained, so memory grows with the
+    float columns only, not with a list of parsed dicts.
     """
-    minutes: List[dict] = []
-    with open(minutes_path, "r", encoding="utf-8") as f:
+    n = 0
+    laeq, freq, mod = array("d"), array("d"), array("d")
+    with open(minutes_path, "rb") as f:
         for line in f:
             line = line.strip()
             if not line:
                 continue
-            minutes.append(json.loads(line))
-    return minutes
-
-
-def _clip(value: float, lo: Optional[float], hi: Optional[float]) -> float:
-    if lo is not None:
-        value = max(lo, value)
-    if hi is not None:
-        value = min(hi, value)
-    return value
+            m = loads_line(line)
+            n += 1
+
+            v = (m.get("audio") or {}).get("laeq_db")
+            if isinstance(v, (int, float)):
+                laeq.append(v)
+
+            l = m.get("light") or {}
+            fr = l.get("tlm_freq_hz")
+            md = l.get("tlm_mod_percent")
+            if isinstance(fr, (int, float)) and isinstance(md, (int, float)):
+                freq.append(fr)
+                mod.append(md)
+
+    return _MinuteColumns(
+        n,
+        np.frombuffer(laeq, dtype=np.float64),
+        np.frombuffer(freq, dtype=np.float64),
+        np.frombuffer(mod, dtype=np.float64),
+    )
 
 
 def evaluate(minutes_path: str, profile: ProfileLike, locale: Optional[str] = None) -> Dict[str, Any]:
@@ -138,8 +205,8 @@ def evaluate(minutes_path: str, profile: ProfileLike, locale: Optional[str] = No
           "trace": {...}
         }
     """
-    minutes = _collect_minutes(minutes_path)
-    n = len(minutes)
+    cols = _collect_minutes(minutes_path)
+    n = cols.n
 
     out: Dict[str, Any] = {
         "n_minutes": n,
@@ -176,19 +243,12 @@ def evaluate(minutes_path: str, profile: ProfileLike, locale: Optional[str] = No
     out["trace"]["locale_resolved"] = loc_norm
     out["trace"]["noise_limit_source"] = limit_src
 
-    laeq_vals: List[float] = []
-    for m in minutes:
-        a = m.get("audio") or {}
-        v = a.get("laeq_db")
-        if isinstance(v, (int, float)):
-            laeq_vals.append(float(v))
-
-    mean_laeq = statistics.fmean(laeq_vals) if laeq_vals else None
-    pct_over = (
-        100.0 * sum(1 for x in laeq_vals if x > float(limit)) / max(len(laeq_vals), 1)
-        if laeq_vals and limit is not None
-        else 0.0
-    )
+    laeq_vals = cols.laeq
+
+    n_laeq = laeq_vals.size
+    laeq_sum, n_over = _sum_and_count_over(laeq_vals, float(limit) if limit is not None else math.inf)
+    mean_laeq = laeq_sum / n_laeq if n_laeq else None
+    pct_over = 100.0 * n_over / n_laeq if n_laeq and limit is not None else 0.0
 
     # Optional percentiles for display
     display_cfg = _get_section(profile, "display")
@@ -214,28 +274,16 @@ def evaluate(minutes_path: str, profile: ProfileLike, locale: Optional[str] = No
     clip_lo = clip_range[0] if isinstance(clip_range, (list, tuple)) and len(clip_range) > 0 else None
     clip_hi = clip_range[1] if isinstance(clip_range, (list, tuple)) and len(clip_range) > 1 else None
 
-    violations = 0
-    evaluated = 0
-    tlm_mod_values: List[float] = []
-
-    for m in minutes:
-        l = m.get("light") or {}
-        f = l.get("tlm_freq_hz")
-        mod = l.get("tlm_mod_percent")
-
-        if not isinstance(f, (int, float)) or not isinstance(mod, (int, float)):
-            continue
-
-        # Clip measured modulation to configured range (avoid silly values from bad devices)
-        mod_c = _clip(float(mod), float(clip_lo) if clip_lo is not None else None,
-                      float(clip_hi) if clip_hi is not None else None)
-
-        allowed = allowed_mod_percent(float(f), flick_cfg.get("percent_mod_vs_freq", {}))  # type: ignore[arg-type]
-        evaluated += 1
-        tlm_mod_values.append(mod_c)
+    # Clip measured modulation to configured range (avoid silly values from bad devices)
+    tlm_mod_values = cols.tlm_mod
+    if clip_lo is not None:
+        tlm_mod_values = np.maximum(tlm_mod_values, float(clip_lo))
+    if clip_hi is not None:
+        tlm_mod_values = np.minimum(tlm_mod_values, float(clip_hi))
 
-        if mod_c > allowed:
-            violations += 1
+    allowed = allowed_mod_percent_many(cols.tlm_freq, flick_cfg.get("percent_mod_vs_freq", {}))  # type: ignore[arg-type]
+    evaluated = int(tlm_mod_values.size)
+    violations = _count_exceeding(tlm_mod_values, allowed)
 
     pct_viol = 100.0 * violations / max(evaluated, 1)
     flick_percentiles = {f"p{p}": _percentile(tlm_mod_values, float(p)) for p in pct_list}
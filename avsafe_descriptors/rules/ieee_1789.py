@@ -1,12 +1,17 @@
 # avsafe_descriptors/rules/ieee_1789.py
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Tuple
 
+import numpy as np
 
 __all__ = [
     "allowed_mod_percent",
+    "allowed_mod_percent_many",
+    "CompiledCurve",
     "classify_modulation",
+    "compile_curve",
     "normalize_curve_config",
 ]
 
@@ -78,7 +83,111 @@ def _clip(value: float, lo: Optional[float], hi: Optional[float]) -> float:
     return value
 
 
-def allowed_mod_percent(f_hz: float, cfg: Dict[str, Any]) -> float:
+# Segment kinds in a compiled curve
+_KIND_DEFAULT, _KIND_AB, _KIND_CAP = 0, 1, 2
+
+
+class CompiledCurve(NamedTuple):
+    """
+    Array form of a normalized curve config, for repeated lookups.
+
+    Segments keep the ``normalize_curve_config`` order (by ``f_min``); the first
+    segment with ``f_min <= f <= f_max`` wins, exactly as in the linear scan.
+    """
+
+    f_min: np.ndarray
+    f_max: np.ndarray
+    kind: np.ndarray
+    a: np.ndarray
+    b: np.ndarray
+    cap: np.ndarray
+    default: float
+    raw_default: float
+    clip: Optional[Tuple[float, float]]
+    # True when f_max is non-decreasing, so the first match is found by bisection
+    bisectable: bool
+    f_max_list: Tuple[float, ...]
+
+
+def _freeze(obj: Any) -> Any:
+    """Hashable snapshot of a (nested) config, used as the compile-cache key."""
+    if isinstance(obj, Mapping):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in obj.items()))
+    if isinstance(obj, (list, tuple)):
+        return tuple(_freeze(v) for v in obj)
+    return obj
+
+
+_COMPILED: Dict[Any, CompiledCurve] = {}
+_COMPILED_MAX = 32
+
+
+def _compile(cfg: Dict[str, Any]) -> CompiledCurve:
+    ncfg = normalize_curve_config(cfg)
+    segs: List[Dict[str, float]] = ncfg["segments"]
+
+    kind = [
+        _KIND_AB if ("a" in s and "b" in s) else _KIND_CAP if "max_percent" in s else _KIND_DEFAULT
+        for s in segs
+    ]
+    f_max_list = tuple(s["f_max"] for s in segs)
+    clip = ncfg.get("clip_allowed_range")
+
+    arrays = (
+        np.array([s["f_min"] for s in segs], dtype=np.float64),
+        np.array(f_max_list, dtype=np.float64),
+        np.array(kind, dtype=np.int8),
+        np.array([s.get("a", 0.0) for s in segs], dtype=np.float64),
+        np.array([s.get("b", 0.0) for s in segs], dtype=np.float64),
+        np.array([s.get("max_percent", 0.0) for s in segs], dtype=np.float64),
+    )
+    for arr in arrays:
+        arr.setflags(write=False)
+
+    return CompiledCurve(
+        *arrays,
+        default=float(ncfg.get("default", 1.0)),
+        raw_default=float((cfg or {}).get("default", 1.0)),
+        clip=(clip[0], clip[1]) if clip else None,
+        bisectable=all(x <= y for x, y in zip(f_max_list, f_max_list[1:])),
+        f_max_list=f_max_list,
+    )
+
+
+def compile_curve(cfg: Dict[str, Any] | CompiledCurve) -> CompiledCurve:
+    """
+    Compile a percent-modulation vs. frequency config into a :class:`CompiledCurve`.
+
+    Results are cached per config *content*, so passing the same profile section
+    on every call costs one hash, not a re-normalization. Already-compiled curves
+    are returned unchanged.
+    """
+    if isinstance(cfg, CompiledCurve):
+        return cfg
+    try:
+        key = _freeze(cfg)
+        hit = _COMPILED.get(key)
+    except TypeError:  # unhashable leaf values: compile without caching
+        return _compile(cfg)
+    if hit is None:
+        if len(_COMPILED) >= _COMPILED_MAX:
+            _COMPILED.clear()
+        hit = _COMPILED[key] = _compile(cfg)
+    return hit
+
+
+def _find_segment(c: CompiledCurve, f_hz: float) -> int:
+    """Index of the first segment containing f_hz, or -1."""
+    if c.bisectable:
+        i = bisect_left(c.f_max_list, f_hz)
+        return i if i < len(c.f_max_list) and c.f_min[i] <= f_hz else -1
+    for i in range(len(c.f_max_list)):
+        if c.f_min[i] <= f_hz <= c.f_max_list[i]:
+            return i
+    return -1
+
+
+def allowed_mod_percent(f_hz: float, cfg: Dict[str, Any] | CompiledCurve) -> float:
     """
     Compute the **allowed percent modulation** at frequency `f_hz` given a
     piecewise configuration. This function provides an *illustrative*
@@ -96,39 +205,80 @@ def allowed_mod_percent(f_hz: float, cfg: Dict[str, Any]) -> float:
     f_hz : float
         Temporal light modulation (TLM) frequency in Hz. Non-positive values
         return the default.
-    cfg : dict
-        Percent-modulation vs. frequency configuration (see above).
+    cfg : dict or CompiledCurve
+        Percent-modulation vs. frequency configuration (see above), or its
+        compiled form from :func:`compile_curve`.
 
     Returns
     -------
     float : allowed percent modulation (>= 0)
     """
+    c = compile_curve(cfg)
     if not isinstance(f_hz, (int, float)) or f_hz <= 0.0:
-        return float(cfg.get("default", 1.0))
+        return c.raw_default
 
-    ncfg = normalize_curve_config(cfg)
-    default_val = float(ncfg.get("default", 1.0))
-    segs: List[Dict[str, float]] = ncfg.get("segments", [])
-
-    allowed = default_val
-    for s in segs:
-        if s["f_min"] <= f_hz <= s["f_max"]:
-            if "a" in s and "b" in s:
-                # Protect against division by zero with a tiny epsilon
-                allowed = float(s["a"]) + float(s["b"]) / max(f_hz, 1e-6)
-            elif "max_percent" in s:
-                allowed = float(s["max_percent"])
-            break
+    allowed = c.default
+    i = _find_segment(c, f_hz)
+    if i >= 0:
+        if c.kind[i] == _KIND_AB:
+            # Protect against division by zero with a tiny epsilon
+            allowed = float(c.a[i]) + float(c.b[i]) / max(f_hz, 1e-6)
+        elif c.kind[i] == _KIND_CAP:
+            allowed = float(c.cap[i])
 
     # Global clamp to avoid unrealistic allowed values
-    clip = ncfg.get("clip_allowed_range")
-    if isinstance(clip, (list, tuple)) and len(clip) == 2:
-        allowed = _clip(allowed, float(clip[0]), float(clip[1]))
+    if c.clip is not None:
+        allowed = _clip(allowed, c.clip[0], c.clip[1])
 
     # Ensure non-negative
     return max(0.0, float(allowed))
 
 
+def allowed_mod_percent_many(
+    freqs_hz: Sequence[float] | np.ndarray, cfg: Dict[str, Any] | CompiledCurve
+) -> np.ndarray:
+    """
+    Vectorized form of :func:`allowed_mod_percent` over many frequencies.
+
+    The segment for each frequency is located with ``np.searchsorted`` over the
+    compiled ``f_max`` array (O(log S) per query); semantics match the scalar
+    function, including the unclamped ``default`` for non-positive frequencies.
+    """
+    f = np.asarray(freqs_hz, dtype=np.float64)
+    c = compile_curve(cfg)
+    nseg = len(c.f_max_list)
+
+    if c.bisectable:
+        idx = np.searchsorted(c.f_max, f, side="left")
+        ok = idx < nseg
+        ok[ok] &= c.f_min[idx[ok]] <= f[ok]
+        seg = np.where(ok, idx, -1)
+    else:
+        seg = np.full(f.shape, -1, dtype=np.intp)
+        for i in range(nseg - 1, -1, -1):  # reverse, so the first match wins
+            seg[(f >= c.f_min[i]) & (f <= c.f_max[i])] = i
+
+    allowed = np.full(f.shape, c.default, dtype=np.float64)
+    hit = seg >= 0
+    if hit.any():
+        s = seg[hit]
+        kind = c.kind[s]
+        fh = f[hit]
+        allowed[hit] = np.where(
+            kind == _KIND_AB,
+            c.a[s] + c.b[s] / np.maximum(fh, 1e-6),
+            np.where(kind == _KIND_CAP, c.cap[s], c.default),
+        )
+
+    if c.clip is not None:
+        allowed = np.clip(allowed, c.clip[0], c.clip[1])
+    allowed = np.maximum(allowed, 0.0)
+
+    # Non-positive frequencies short-circuit to the raw default, as in the scalar form
+    allowed[f <= 0.0] = c.raw_default
+    return allowed
+
+
 def classify_modulation(
     f_hz: float,
     measured_mod_percent: float,
@@ -1,11 +1,14 @@
 # avsafe_descriptors/rules/profile_loader.py
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import os
+import pickle
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import yaml
 
@@ -100,18 +103,76 @@ def _normalize_flicker(cfg: Dict[str, Any]) -> Dict[str, Any]:
     return flicker
 
 
-def _load_text(path_or_text: str) -> str:
+def _load_text(path_or_text: str) -> Tuple[str, bool]:
+    """Return (text, came_from_file)."""
     p = Path(path_or_text)
     if p.exists():
-        return p.read_text(encoding="utf-8")
+        return p.read_text(encoding="utf-8"), True
     # Allow passing raw YAML (e.g., API uploads) as a convenience
-    return path_or_text
+    return path_or_text, False
+
+
+# -------- On-disk cache of parsed profiles --------
+# Keyed by a hash of the file *content* (plus a format version), so edits, copies and
+# touch-only mtime changes all resolve correctly. Disable with AVSAFE_PROFILE_CACHE=0.
+_CACHE_FORMAT = 1
+
+
+def _loader_digest() -> str:
+    """Digest of the code that builds a RulesProfile, so pickles from other versions miss."""
+    from . import ieee_1789
+
+    h = hashlib.sha256()
+    try:
+        for mod_file in (__file__, ieee_1789.__file__):
+            h.update(Path(mod_file).read_bytes())
+    except OSError:  # no readable source (frozen/zip installs): fall back to the version
+        from .. import __version__
+
+        return __version__
+    return h.hexdigest()[:16]
+
+
+_LOADER_DIGEST = _loader_digest()
+
+
+def _cache_path(raw: str) -> Optional[Path]:
+    if os.environ.get("AVSAFE_PROFILE_CACHE", "1") == "0":
+        return None
+    base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    key = f"v{_CACHE_FORMAT}\0{_LOADER_DIGEST}\0{raw}"
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    return base / "avsafe" / "profiles" / f"{digest}.pkl"
+
+
+def _cache_get(path: Path) -> Optional[RulesProfile]:
+    try:
+        with path.open("rb") as f:
+            obj = pickle.load(f)
+    except Exception:
+        return None
+    return obj if isinstance(obj, RulesProfile) else None
+
+
+def _cache_put(path: Path, profile: RulesProfile) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with tmp.open("wb") as f:
+            pickle.dump(profile, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except Exception as e:  # cache is best-effort (read-only home, etc.)
+        log.debug("Profile cache write skipped: %s", e)
 
 
 def load_profile(path_or_text: str) -> RulesProfile:
     """
     Load a rules profile from a YAML/JSON file path or raw YAML string.
 
+    Profiles loaded from files are cached as pickles under
+    ``$XDG_CACHE_HOME/avsafe/profiles`` (default ``~/.cache``), keyed by content
+    hash, so repeat CLI runs skip the YAML parse.
+
     Parameters
     ----------
     path_or_text : str
@@ -126,8 +187,31 @@ def load_profile(path_or_text: str) -> RulesProfile:
     ProfileError
         If parsing or validation fails.
     """
-    raw = _load_text(path_or_text)
+    raw, from_file = _load_text(path_or_text)
+
+    cache_path = _cache_path(raw) if from_file else None
+    if cache_path is not None:
+        cached = _cache_get(cache_path)
+        if cached is not None:
+            return cached
+
+    profile = _parse_profile(raw)
+    if cache_path is not None:
+        _cache_put(cache_path, profile)
+    return profile
+
+
+def load_profile_text(text: str) -> RulesProfile:
+    """
+    Parse a rules profile from YAML/JSON *content* (never treated as a path).
+
+    Unlike :func:`load_profile`, this skips the filesystem probe and the on-disk
+    cache; callers holding many inline profiles (e.g. the API) cache in memory.
+    """
+    return _parse_profile(text)
+
 
+def _parse_profile(raw: str) -> RulesProfile:
     try:
         # Accept YAML superset (JSON is valid YAML)
         cfg = yaml.safe_load(raw)
@@ -1,22 +1,27 @@
 # avsafe_descriptors/server/app.py
 from __future__ import annotations
 
+import hashlib
 import json
 import os
+import shutil
 import tempfile
+import threading
 import uuid
 from collections import defaultdict
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+import anyio
+import anyio.to_thread
 from fastapi import FastAPI, UploadFile, Header, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse
 
-from sqlalchemy import create_engine, text
-
 from ..io import sqlite_store  # uses ensure_schema(...) and ingest(...)
-from ..rules.profile_loader import load_profile
+from ..io.jsonl_io import loads_line
+from ..rules.profile_loader import RulesProfile, load_profile_text
 from ..rules.evaluator import evaluate
-from ..report.render_html import render
+from ..report.render_html import render_to_string, warmup as _warmup_renderer
 
 # ---------------------------------------------------------------------------
 # Config & startup
@@ -24,6 +29,18 @@ from ..report.render_html import render
 
 DB = os.environ.get("AVSAFE_DB", "avsafe.db")
 sqlite_store.ensure_schema(DB)
+ENGINE = sqlite_store.open_engine(DB)  # shared pool for the process lifetime
+
+
+def _prewarm_pool() -> None:
+    """Open every persistent pool connection up front, so the first requests skip connect + PRAGMAs."""
+    conns = [ENGINE.raw_connection() for _ in range(ENGINE.pool.size())]
+    for c in conns:
+        c.close()  # back to the pool, still open
+
+
+_prewarm_pool()
+_warmup_renderer()
 
 app = FastAPI(
     title="AV-SAFE Receiver",
@@ -31,6 +48,31 @@ app = FastAPI(
     version="1.0.0",
 )
 
+
+def _pick_scratch_dir() -> Optional[str]:
+    """
+    Per-request scratch files (minutes dumps, results) are written and re-read
+    immediately, so prefer tmpfs (/dev/shm) when it exists and has room; otherwise
+    return None and let tempfile use the platform default (macOS/Windows, small shm).
+    AVSAFE_SCRATCH_DIR overrides the choice.
+    """
+    override = os.environ.get("AVSAFE_SCRATCH_DIR")
+    if override:
+        os.makedirs(override, exist_ok=True)
+        return override
+    shm = "/dev/shm"
+    try:
+        if os.path.isdir(shm) and shutil.disk_usage(shm).free >= 256 * 1024 * 1024:
+            path = os.path.join(shm, "avsafe")
+            os.makedirs(path, exist_ok=True)
+            return path
+    except OSError:
+        pass
+    return None
+
+
+_SCRATCH_DIR = _pick_scratch_dir()
+
 # Simple in-memory cache for idempotency (survives per-process; fine for dev/demo)
 _IDEMP_CACHE: dict[tuple[str, str], dict] = {}
 # (Optional) record of last upload stats per session for report convenience
@@ -49,18 +91,97 @@ def _err(code: str, message: str, status: int = 400, details: Optional[Dict[str,
     return JSONResponse({"error": {"code": code, "message": message, "details": details or {}}}, status_code=status)
 
 
-def _parse_jsonl_bytes(raw: bytes) -> List[dict]:
-    """Parse newline-delimited JSON, skipping blank lines and raising on malformed rows."""
-    out: List[dict] = []
-    for i, line in enumerate(raw.decode("utf-8", errors="strict").splitlines()):
-        if not line.strip():
+# Parsed inline profiles keyed by blake2b of the YAML text (RulesProfile is frozen, so
+# sharing one instance across requests is safe). Insertion-ordered dict used as a small LRU;
+# _evaluate_session runs in worker threads, so every dict operation holds the lock.
+_PROFILE_CACHE: Dict[str, RulesProfile] = {}
+_PROFILE_CACHE_MAX = 32
+_PROFILE_CACHE_LOCK = threading.Lock()
+
+
+def _profile_from_yaml(yaml_text: str) -> RulesProfile:
+    key = hashlib.blake2b(yaml_text.encode("utf-8"), digest_size=16).hexdigest()
+    with _PROFILE_CACHE_LOCK:
+        prof = _PROFILE_CACHE.pop(key, None)
+        if prof is not None:
+            _PROFILE_CACHE[key] = prof
+            return prof
+    # Parse outside the lock; two threads racing on the same text both parse, last wins
+    prof = load_profile_text(yaml_text)
+    with _PROFILE_CACHE_LOCK:
+        _PROFILE_CACHE.pop(key, None)
+        while len(_PROFILE_CACHE) >= _PROFILE_CACHE_MAX:
+            _PROFILE_CACHE.pop(next(iter(_PROFILE_CACHE)))
+        _PROFILE_CACHE[key] = prof
+    return prof
+
+
+# CPU-heavy endpoint work (evaluate, render) runs in worker threads capped at the core
+# count, separate from the default threadpool that serves uploads. Created lazily: the
+# limiter must be built inside the running event loop.
+_CPU_LIMITER: Optional[anyio.CapacityLimiter] = None
+
+
+async def _run_cpu_bound(fn, *args):
+    global _CPU_LIMITER
+    if _CPU_LIMITER is None:
+        _CPU_LIMITER = anyio.CapacityLimiter(os.cpu_count() or 1)
+    return await anyio.to_thread.run_sync(fn, *args, limiter=_CPU_LIMITER)
+
+
+# Records per executemany during upload ingest
+_INGEST_BATCH = 10_000
+
+
+def _ingest_jsonl_lines(session_id: str, lines: Iterable[bytes]) -> Tuple[int, int, bool]:
+    """
+    Parse, sanity-check and store uploaded JSONL lines in batches, all in one transaction.
+
+    Returns (accepted, rejected, any_signed). Raises ValueError on a malformed line, in
+    which case the transaction is rolled back and nothing is stored.
+    """
+    accepted = rejected = 0
+    signed = False
+    batch: List[dict] = []
+
+    with ENGINE.begin() as cx:
+        for i, line in enumerate(lines):
+            if not line.strip():
+                continue
+            try:
+                m = loads_line(line)
+            except Exception as e:
+                raise ValueError(f"Malformed JSONL at line {i+1}: {e}") from e
+
+            if _basic_minute_check(m):
+                rejected += 1
+                continue
+            signed = signed or bool(m["chain"].get("signature_hex"))
+            batch.append(m)
+            if len(batch) >= _INGEST_BATCH:
+                accepted += sqlite_store.ingest_batch(cx, session_id, batch)
+                batch.clear()
+
+        accepted += sqlite_store.ingest_batch(cx, session_id, batch)
+
+    return accepted, rejected, signed
+
+
+def _scratch_path(suffix: str) -> str:
+    """Create an empty scratch file (tmpfs when available) and return its path."""
+    fd, path = tempfile.mkstemp(suffix=suffix, prefix="avsafe_", dir=_SCRATCH_DIR)
+    os.close(fd)
+    return path
+
+
+def _remove_quietly(*paths: Optional[str]) -> None:
+    for p in paths:
+        if p is None:  # not created yet
             continue
         try:
-            obj = json.loads(line)
-            out.append(obj)
-        except Exception as e:
-            raise ValueError(f"Malformed JSONL at line {i+1}: {e}") from e
-    return out
+            os.remove(p)
+        except OSError:
+            pass
 
 
 def _basic_minute_check(m: dict) -> Optional[str]:
@@ -115,28 +236,13 @@ async def ingest_jsonl(
             # Return the previous receipt verbatim
             return _ok(_IDEMP_CACHE[cache_key], status=200)
 
-    # Read upload
-    raw = await file.read()
+    # Stream the (spooled) upload line by line: quick validation, batched inserts.
+    # Parsing and SQLite writes are blocking, so they run in the threadpool, not on the event loop.
     try:
-        records = _parse_jsonl_bytes(raw)
+        rows, rejected, signed = await run_in_threadpool(_ingest_jsonl_lines, session_id, file.file)
     except ValueError as e:
         return _err("bad_request", f"{e}", status=400)
 
-    # Quick validation & stats
-    accepted: List[dict] = []
-    rejected = 0
-    for m in records:
-        reason = _basic_minute_check(m)
-        if reason:
-            rejected += 1
-            continue
-        accepted.append(m)
-
-    # Store accepted minutes
-    rows = 0
-    if accepted:
-        rows = sqlite_store.ingest(DB, session_id, accepted)
-
     receipt = {
         "session_id": session_id,
         "accepted_records": rows,
@@ -144,7 +250,7 @@ async def ingest_jsonl(
         "checks": {
             "schema": "ok" if rejected == 0 else "partial",
             "chain_hash": "unchecked",   # deeper verification lives in evaluator/server-side pipeline
-            "signatures": "present" if any(m.get("chain", {}).get("signature_hex") for m in accepted) else "missing",
+            "signatures": "present" if signed else "missing",
         },
     }
 
@@ -173,50 +279,34 @@ async def run_evaluate(
     if not rules_yaml or not isinstance(rules_yaml, str):
         return _err("bad_request", "rules_yaml required (string)", status=400)
 
-    # Load profile from inline YAML (tempfile)
-    with tempfile.NamedTemporaryFile("w+", suffix=".yaml", delete=False) as tf:
-        tf.write(rules_yaml)
-        tf.flush()
-        prof = load_profile(tf.name)
-
-    # Fetch minutes for this session in index order
-    eng = create_engine(f"sqlite:///{DB}")
-    with eng.begin() as cx:
-        rows = cx.execute(
-            text("SELECT * FROM minutes WHERE session=:s ORDER BY idx"),
-            {"s": session_id},
-        ).mappings().all()
-
-    if not rows:
+    # Profile parse, SQLite dump and evaluation are blocking: run them off the event loop
+    res = await _run_cpu_bound(_evaluate_session, session_id, rules_yaml, locale)
+    if res is None:
         return _err("unprocessable", "No minutes ingested for this session.", status=422)
 
-    minutes_path = tempfile.mktemp(suffix=".jsonl")
-    with open(minutes_path, "w", encoding="utf-8") as f:
-        for r in rows:
-            rec = {
-                "idx": r["idx"],
-                "ts": r["ts"],
-                "audio": {"laeq_db": r["laeq"], "lcpeak_db": r["lcpeak"], "third_octave_db": json.loads(r["third_oct"]) if r["third_oct"] else {}},
-                "light": {"tlm_freq_hz": r["tlm_freq_hz"], "tlm_mod_percent": r["tlm_mod_percent"], "flicker_index": r["flicker_index"]},
-                "chain": {
-                    "hash": r["chain_hash"],
-                    "signature_hex": r["signature_hex"],
-                    "scheme": r["scheme"],
-                    "public_key_hex": r["public_key_hex"],
-                },
-            }
-            f.write(json.dumps(rec, ensure_ascii=False) + "\n")
-
-    # Evaluate
-    res = evaluate(minutes_path, prof, locale=locale)
     # Keep a pointer for the report page convenience
     _SESSION_LAST_RESULTS[session_id]["last_results"] = res
 
     return _ok(res, status=200)
 
 
+def _evaluate_session(session_id: str, rules_yaml: str, locale: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Evaluate a session's stored minutes against inline rules; None if it has no minutes."""
+    # Parse the inline profile (cached by content hash)
+    prof = _profile_from_yaml(rules_yaml)
+
+    minutes_path = _scratch_path(".jsonl")
+    try:
+        # Dump minutes for this session (index order) straight from SQLite
+        if not sqlite_store.dump_minutes_jsonl(DB, session_id, minutes_path):
+            return None
+        return evaluate(minutes_path, prof, locale=locale)
+    finally:
+        _remove_quietly(minutes_path)
+
+
 @app.get("/session/{session_id}/report", response_class=HTMLResponse)
-def get_report(
+async def get_report(
     session_id: str,
     public_key_hex: Optional[str] = None,
 ):
@@ -224,48 +314,35 @@ def get_report(
     Render a human-readable HTML report.
     If results from /evaluate are cached, reuse them; otherwise produce a neutral placeholder.
     """
+    html = await _run_cpu_bound(_render_session_report, session_id, public_key_hex)
+    return HTMLResponse(html)
+
+
+def _render_session_report(session_id: str, public_key_hex: Optional[str]) -> str:
     # Pull minutes (cap rows for faster render)
-    eng = create_engine(f"sqlite:///{DB}")
-    with eng.begin() as cx:
-        rows = cx.execute(
-            text("SELECT * FROM minutes WHERE session=:s ORDER BY idx LIMIT 2000"),
-            {"s": session_id},
-        ).mappings().all()
-
-    minutes_path = tempfile.mktemp(suffix=".jsonl")
-    with open(minutes_path, "w", encoding="utf-8") as f:
-        for r in rows:
-            rec = {
-                "idx": r["idx"],
-                "ts": r["ts"],
-                "audio": {"laeq_db": r["laeq"], "lcpeak_db": r["lcpeak"], "third_octave_db": json.loads(r["third_oct"]) if r["third_oct"] else {}},
-                "light": {"tlm_freq_hz": r["tlm_freq_hz"], "tlm_mod_percent": r["tlm_mod_percent"], "flicker_index": r["flicker_index"]},
-                "chain": {
-                    "hash": r["chain_hash"],
-                    "signature_hex": r["signature_hex"],
-                    "scheme": r["scheme"],
-                    "public_key_hex": r["public_key_hex"],
-                },
-            }
-            f.write(json.dumps(rec, ensure_ascii=False) + "\n")
-
-    # Use last evaluation if available; otherwise a minimal placeholder
-    results_obj = _SESSION_LAST_RESULTS.get(session_id, {}).get("last_results") or {
-        "n_minutes": len(rows),
-        "flags": [],
-        "noise": {"limit_db": None, "pct_over": 0, "mean_laeq": 0, "percentiles": None},
-        "flicker": {"evaluated": 0, "violations": 0, "pct_violations": 0, "notes": "No evaluation run yet."},
-        "trace": {"profile_id": None, "rules_version": "v1.0.0"},
-    }
+    minutes_path = _scratch_path(".jsonl")
+    results_path: Optional[str] = None
+    try:
+        n_rows = sqlite_store.dump_minutes_jsonl(DB, session_id, minutes_path, limit=2000)
 
-    # Render HTML
-    out_html = tempfile.mktemp(suffix=".html")
-    foot = None
-    if public_key_hex:
-        foot = f"Verification hint: client provided public key {public_key_hex[:16]}… (server-side signature checks appear in Integrity section)."
+        # Use last evaluation if available; otherwise a minimal placeholder
+        results_obj = _SESSION_LAST_RESULTS.get(session_id, {}).get("last_results") or {
+            "n_minutes": n_rows,
+            "flags": [],
+            "noise": {"limit_db": None, "pct_over": 0, "mean_laeq": 0, "percentiles": None},
+            "flicker": {"evaluated": 0, "violations": 0, "pct_violations": 0, "notes": "No evaluation run yet."},
+            "trace": {"profile_id": None, "rules_version": "v1.0.0"},
+        }
 
-    render(minutes_path, results_path=_dump_json_temp(results_obj), out_html=out_html, footnote=foot)
-    return HTMLResponse(open(out_html, "r", encoding="utf-8").read())
+        # Render HTML
+        results_path = _dump_json_temp(results_obj)
+        foot = None
+        if public_key_hex:
+            foot = f"Verification hint: client provided public key {public_key_hex[:16]}… (server-side signature checks appear in Integrity section)."
+
+        return render_to_string(minutes_path, results_path, footnote=foot)
+    finally:
+        _remove_quietly(minutes_path, results_path)
 
 
 # ---------------------------------------------------------------------------
@@ -273,7 +350,11 @@ def get_report(
 # ---------------------------------------------------------------------------
 
 def _dump_json_temp(obj: Dict[str, Any]) -> str:
-    path = tempfile.mktemp(suffix=".json")
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(obj, f, ensure_ascii=False, indent=2)
+    path = _scratch_path(".json")
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(obj, f, ensure_ascii=False, indent=2)
+    except BaseException:
+        _remove_quietly(path)
+        raise
     return path
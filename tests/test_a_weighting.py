@@ -0,0 +1,84 @@
+# tests/test_a_weighting.py
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from avsafe_descriptors.audio.a_weighting import (
+    A_WEIGHT_AT_NOMINAL,
+    ISO_THIRD_OCTAVE_CENTERS,
+    a_weight_db,
+    a_weight_db_many,
+    a_weight_table,
+    a_weight_vector,
+    a_weighted_level_sum,
+    overall_level_dba,
+)
+
+
+def test_normalized_to_zero_at_1k():
+    assert a_weight_db(1000.0) == pytest.approx(0.0, abs=1e-9)
+    assert a_weight_db_many([1000.0])[0] == pytest.approx(0.0, abs=1e-9)
+
+
+def test_vector_form_matches_scalar():
+    freqs = [20.0, 31.5, 63.0, 125.0, 1000.0, 4000.0, 16000.0]
+    vec = a_weight_db_many(freqs)
+    assert isinstance(vec, np.ndarray)
+    for f, v in zip(freqs, vec):
+        assert v == pytest.approx(a_weight_db(f), abs=1e-12)
+
+
+def test_vector_form_rejects_nonpositive():
+    with pytest.raises(ValueError):
+        a_weight_db_many([100.0, 0.0])
+
+
+def test_nominal_table_matches_formula():
+    assert set(A_WEIGHT_AT_NOMINAL) == set(ISO_THIRD_OCTAVE_CENTERS)
+    for c, a in A_WEIGHT_AT_NOMINAL.items():
+        assert a == pytest.approx(a_weight_db(c), abs=1e-12)
+
+
+def test_overall_level_same_for_table_and_offgrid_centers():
+    # 1000.0 hits the nominal table; 1000.0 + 1e-9 forces the vector path
+    on_grid = overall_level_dba([60.0, 55.0], [1000.0, 2000.0])
+    off_grid = overall_level_dba([60.0, 55.0], [1000.0 + 1e-9, 2000.0])
+    assert on_grid == pytest.approx(off_grid, abs=1e-6)
+
+
+def test_table_rounding():
+    tbl = a_weight_table([100.0, 1000.0], rounding=1)
+    assert tbl == {100.0: round(a_weight_db(100.0), 1), 1000.0: 0.0}
+
+
+def test_overall_level_single_1k_band_is_identity():
+    assert overall_level_dba([60.0], [1000.0]) == pytest.approx(60.0, abs=1e-9)
+
+
+def test_overall_level_energy_sum():
+    # Two equal bands at 1 kHz-ish weighting sum to +3.01 dB
+    lvl = overall_level_dba([60.0, 60.0], [1000.0, 1000.0])
+    assert lvl == pytest.approx(60.0 + 10.0 * math.log10(2.0), abs=1e-9)
+
+
+def test_overall_level_length_mismatch():
+    with pytest.raises(ValueError):
+        overall_level_dba([60.0], [1000.0, 2000.0])
+
+
+def test_overall_level_wide_dynamic_range_is_stable():
+    # 10^(L/10) overflows/underflows float64 here; log-sum-exp must not
+    assert overall_level_dba([400.0, 400.0], [1000.0, 1000.0]) == pytest.approx(403.0103, abs=1e-4)
+    assert overall_level_dba([-400.0], [1000.0]) == pytest.approx(-400.0, abs=1e-9)
+    assert overall_level_dba([float("-inf")] * 2, [100.0, 1000.0]) == float("-inf")
+
+
+def test_resolved_weights_match_overall_level():
+    centers = [100.0, 1000.0, 1234.5]
+    levels = [50.0, 60.0, 55.0]
+    w = a_weight_vector(centers)
+    assert not w.flags.writeable
+    assert a_weighted_level_sum(levels, w) == overall_level_dba(levels, centers)
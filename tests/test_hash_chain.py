@@ -9,6 +9,8 @@ import pytest
 
 from avsafe_descriptors.integrity.hash_chain import (
     canonical_json,
+    canonical_json_bytes,
+    chain_digest,
     chain_hash,
 )
 
@@ -45,6 +47,11 @@ def test_canonical_json_raises_on_non_serializable():
         canonical_json({"x": NotJSON()})
 
 
+def test_canonical_json_float_formatting_is_pinned():
+    """Hashed bytes must not depend on the JSON backend's float formatting."""
+    assert canonical_json({"a": 1e-05, "b": 1e16, "c": 0.1}) == '{"a":1e-05,"b":1e+16,"c":0.1}'
+
+
 def test_chain_hash_first_block_matches_manual_sha256():
     """When prev_hash is None, chain_hash should hash canonical_json(payload) exactly."""
     payload = {"idx": 0, "a": 1}
@@ -119,3 +126,14 @@ def test_chain_hash_randomized_sequence_is_consistent():
         prev = h
 
     assert chain1 == chain2
+
+
+@pytest.mark.parametrize("alg", ["sha256", "blake2b"])
+def test_chain_digest_matches_hex_chain(alg):
+    """Carrying raw digests forward must reproduce the hex chain link for link."""
+    prev_hex, prev_digest = None, None
+    for i in range(5):
+        p = {"idx": i, "v": i * 0.5}
+        prev_hex = chain_hash(prev_hex, p, alg=alg)
+        prev_digest = chain_digest(prev_digest, canonical_json_bytes(p), alg=alg)
+        assert prev_digest.hex() == prev_hex
@@ -0,0 +1,117 @@
+# tests/test_hf_avc_ingest.py
+from __future__ import annotations
+
+import json
+import sqlite3
+
+import pytest
+
+from avsafe_descriptors.hf_avc import ingest_cli
+from avsafe_descriptors.hf_avc.ingest_cli import (
+    DDL,
+    canonical_json,
+    canonical_json_bytes,
+    ingest_files,
+)
+from avsafe_descriptors.io.jsonl_io import loads_line
+
+
+@pytest.mark.parametrize("src", [
+    b'{"id":"case:1","title":"T","laeq":{"min":55.5,"max":82.0},"tags":null}',
+    b'{"s":"\\u00e9\\u2028\\ud83d\\ude00","n":-0.0,"k":{"z":1,"\\u00e9":2}}',
+    b'{"tiny":1e-7,"big":3e20,"text":"1e5"}',
+    b'{"a":NaN,"b":Infinity}',
+    b'{"huge":12345678901234567890123}',
+])
+def test_canonical_bytes_match_stdlib_canonical_json(src):
+    # json_hash is stored: the fast path must never change the canonical text
+    obj = loads_line(src)
+    assert canonical_json_bytes(obj, src) == canonical_json(obj).encode("utf-8")
+
+
+def _write_case(path, **extra):
+    case = {"id": "case:1", "title": "T", "summary": "s", **extra}
+    path.write_text(json.dumps(case), encoding="utf-8")
+    return path
+
+
+def _file_shas(db):
+    with sqlite3.connect(db) as con:
+        return dict(con.execute("SELECT id, file_sha FROM hf_cases"))
+
+
+def test_unchanged_file_is_skipped_by_file_sha(tmp_path, capsys):
+    db = tmp_path / "hf.db"
+    case = _write_case(tmp_path / "c.json")
+    assert ingest_files(db, [case], None) == (1, 0, 0)
+    assert ingest_files(db, [case], None) == (0, 0, 1)
+    assert "unchanged (same file)" in capsys.readouterr().out
+
+
+def test_reformatted_file_backfills_file_sha(tmp_path, capsys):
+    db = tmp_path / "hf.db"
+    case = _write_case(tmp_path / "c.json")
+    ingest_files(db, [case], None)
+    first = _file_shas(db)["case:1"]
+
+    # Same canonical content, different bytes: skipped by json_hash, file_sha refreshed
+    case.write_text(json.dumps(loads_line(case.read_bytes()), indent=2), encoding="utf-8")
+    assert ingest_files(db, [case], None) == (0, 0, 1)
+    assert "unchanged (same hash)" in capsys.readouterr().out
+    assert _file_shas(db)["case:1"] not in (None, first)
+    assert ingest_files(db, [case], None) == (0, 0, 1)
+    assert "unchanged (same file)" in capsys.readouterr().out
+
+
+def test_old_db_gets_file_sha_column(tmp_path):
+    db = tmp_path / "hf.db"
+    with sqlite3.connect(db) as con:
+        con.executescript(DDL.replace("  file_sha TEXT,\n", ""))
+    assert "file_sha" not in {r[1] for r in sqlite3.connect(db).execute("PRAGMA table_info(hf_cases)")}
+
+    case = _write_case(tmp_path / "c.json")
+    assert ingest_files(db, [case], None) == (1, 0, 0)
+    assert _file_shas(db)["case:1"] is not None
+
+
+def test_schema_validation_is_not_skipped_by_file_sha(tmp_path, capsys):
+    db = tmp_path / "hf.db"
+    case = _write_case(tmp_path / "c.json")
+    ingest_files(db, [case], None)
+
+    schema = tmp_path / "schema.json"
+    schema.write_text(json.dumps({"type": "object", "required": ["jurisdiction"]}), encoding="utf-8")
+    assert ingest_files(db, [case], schema) == (0, 0, 0)
+    assert "[FAIL]" in capsys.readouterr().err
+
+
+def test_failed_row_is_not_remembered_as_written(tmp_path, capsys):
+    db = tmp_path / "hf.db"
+    bad = tmp_path / "a.json"
+    bad.write_text(json.dumps({"id": "case:1", "title": None}), encoding="utf-8")  # title NOT NULL
+    good = _write_case(tmp_path / "b.json")
+    assert ingest_files(db, [bad, good], None) == (1, 0, 0)
+    assert "[FAIL]" in capsys.readouterr().err
+    assert ingest_files(db, [bad, good], None) == (0, 0, 1)
+
+
+def test_strict_abort_rolls_back_earlier_batches(tmp_path, monkeypatch):
+    monkeypatch.setattr(ingest_cli, "INGEST_BATCH", 2)
+    db = tmp_path / "hf.db"
+    cases = [_write_case(tmp_path / f"c{i}.json", id=f"case:{i}") for i in range(5)]
+    bad = tmp_path / "z.json"
+    bad.write_text(json.dumps({"id": "case:bad", "title": None}), encoding="utf-8")  # title NOT NULL
+    with pytest.raises(sqlite3.IntegrityError):
+        ingest_files(db, cases + [bad], None, strict=True)
+    assert _file_shas(db) == {}
+
+
+def test_stored_file_is_not_skipped_after_its_row_is_rewritten(tmp_path):
+    db = tmp_path / "hf.db"
+    old = _write_case(tmp_path / "b_old.json", title="OLD")
+    ingest_files(db, [old], None)
+
+    new = _write_case(tmp_path / "a_new.json", title="NEW")
+    assert ingest_files(db, [new, old], None) == (0, 2, 0)
+    with sqlite3.connect(db) as con:
+        assert con.execute("SELECT title FROM hf_cases").fetchall() == [("OLD",)]
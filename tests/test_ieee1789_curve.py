@@ -4,6 +4,7 @@ import pytest
 
 from avsafe_descriptors.rules.ieee_1789 import (
     allowed_mod_percent,
+    allowed_mod_percent_many,
     classify_modulation,
     normalize_curve_config,
 )
@@ -98,3 +99,29 @@ def test_classify_modulation_within_and_exceeds():
     assert res_exceed["status"] == "exceeds"
     assert res_exceed["allowed"] == pytest.approx(6.1, rel=1e-6)
     assert res_exceed["margin"] > 0.0
+
+
+def test_vector_form_matches_scalar():
+    cfg = _baseline_cfg()
+    # Includes segment boundaries (120, 200, 1000), gaps, and non-positive frequencies
+    freqs = [-1.0, 0.0, 50.0, 80.0, 100.0, 120.0, 150.0, 200.0, 999.0, 1000.0, 1500.0, 2000.0, 5000.0]
+    vec = allowed_mod_percent_many(freqs, cfg)
+    assert vec.shape == (len(freqs),)
+    for f, y in zip(freqs, vec):
+        assert y == pytest.approx(allowed_mod_percent(f, cfg), rel=1e-12)
+
+
+def test_nested_segments_keep_first_match_semantics():
+    # f_max is not monotone here, so the lookup cannot bisect; first (by f_min) still wins
+    cfg = {
+        "default": 1.0,
+        "segments": [
+            {"f_min": 100, "f_max": 1000, "max_percent": 5.0},
+            {"f_min": 200, "f_max": 300, "max_percent": 9.0},
+            {"f_min": 1000, "f_max": 2000, "max_percent": 7.0},
+        ],
+    }
+    freqs = [150.0, 250.0, 1000.0, 1500.0, 2500.0]
+    expected = [5.0, 5.0, 5.0, 7.0, 1.0]
+    assert [allowed_mod_percent(f, cfg) for f in freqs] == expected
+    assert allowed_mod_percent_many(freqs, cfg).tolist() == expected
@@ -0,0 +1,27 @@
+# tests/test_jsonl_io.py
+from __future__ import annotations
+
+import json
+import math
+
+import pytest
+
+from avsafe_descriptors.io.jsonl_io import dumps_line, loads_line
+
+
+@pytest.mark.parametrize("indent", [0, 2, 4])
+def test_dumps_line_keeps_non_finite_floats(indent):
+    """NaN/Infinity stay distinguishable from missing (null) values, as with json.dumps."""
+    rec = {"a": float("nan"), "b": [float("inf"), -float("inf")], "c": None, "d": 1.5}
+    out = dumps_line(rec, indent=indent)
+    assert b"NaN" in out and b"-Infinity" in out
+
+    back = loads_line(out)
+    assert math.isnan(back["a"])
+    assert back["b"] == [math.inf, -math.inf]
+    assert back["c"] is None and back["d"] == 1.5
+
+
+def test_dumps_line_finite_matches_json():
+    rec = {"idx": 3, "x": 0.006049685055722206, "s": "café", "n": None, "k": {1: True}}
+    assert loads_line(dumps_line(rec)) == json.loads(json.dumps(rec))
@@ -5,7 +5,7 @@ import json
 from pathlib import Path
 import pytest
 
-from avsafe_descriptors.rules.profile_loader import load_profile
+from avsafe_descriptors.rules.profile_loader import load_profile, load_profile_text
 from avsafe_descriptors.rules.evaluator import evaluate
 
 
@@ -140,3 +140,22 @@ def test_locale_fallback_does_not_crash(tmp_path: Path):
     except ValueError:
         # Acceptable outcome: explicit error about unknown locale
         pass
+
+
+def test_profile_cache_roundtrip(tmp_path: Path, monkeypatch):
+    """A second load of the same file is served from the on-disk cache and is equal."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.delenv("AVSAFE_PROFILE_CACHE", raising=False)
+
+    fresh = _load_default_profile()
+    cached_files = list((tmp_path / "cache" / "avsafe" / "profiles").glob("*.pkl"))
+    assert len(cached_files) == 1
+
+    again = _load_default_profile()
+    assert again == fresh
+
+
+def test_profile_from_text_matches_file():
+    """Inline YAML content parses to the same profile as the file it came from."""
+    text = Path("avsafe_descriptors/rules/profiles/who_ieee_profile.yaml").read_text(encoding="utf-8")
+    assert load_profile_text(text) == _load_default_profile()
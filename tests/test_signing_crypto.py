@@ -75,3 +75,19 @@ def test_deterministic_with_fixed_private_key(monkeypatch: pytest.MonkeyPatch) -
     assert sig1["scheme"] == "ed25519"
     assert len(sig1["public_key_hex"]) == 64
     assert len(sig1["signature_hex"]) == 128
+
+
+def test_sign_many_matches_sign_bytes(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A batch signs each message exactly as sign_bytes would, with the key resolved once."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from avsafe_descriptors.integrity.signing import sign_bytes, sign_many  # type: ignore
+
+    monkeypatch.delenv("AVSAFE_STRICT_CRYPTO", raising=False)
+    key_hex = "0123456789abcdeffedcba98765432100123456789abcdeffedcba9876543210"
+    msgs = [b"m0", b"m1", b"m2", b"m3"]
+
+    expected = [sign_bytes(m, key_hex) for m in msgs]
+    assert sign_many(msgs, key_hex) == expected
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        assert sign_many(msgs, key_hex, executor=ex) == expected
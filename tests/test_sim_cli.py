@@ -0,0 +1,92 @@
+# tests/test_sim_cli.py
+from __future__ import annotations
+
+import gzip
+import json
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from avsafe_descriptors.cli import sim
+from avsafe_descriptors.integrity.hash_chain import canonical_json_bytes, verify_chain
+from avsafe_descriptors.integrity.signing import verify_bytes
+
+# Fixed seed and start so runs are byte-comparable; a low light rate keeps them quick
+BASE_ARGS = ["--seed", "7", "--start", "2025-01-01T00:00:00Z", "--light-fs", "500"]
+
+
+def _run(tmp_path: Path, name: str, *extra: str, minutes: int = 12) -> Path:
+    out = tmp_path / name
+    rc = sim.main([*BASE_ARGS, "--minutes", str(minutes), "--outfile", str(out), *extra])
+    assert rc == sim.EXIT_OK
+    return out
+
+
+def _records(path: Path) -> List[dict]:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_output_does_not_depend_on_jobs(tmp_path: Path):
+    """Payloads built in worker processes are chained in order: same bytes as in-process."""
+    one = _run(tmp_path, "j1.jsonl", "--jobs", "1", minutes=150)
+    three = _run(tmp_path, "j3.jsonl", "--jobs", "3", minutes=150)
+    assert one.read_bytes() == three.read_bytes()
+
+
+def test_chain_and_signatures_verify(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Every link re-hashes from the payload, and every signature covers the canonical payload."""
+    monkeypatch.setenv("AVSAFE_PRIV_HEX", "0123456789abcdeffedcba98765432100123456789abcdeffedcba9876543210")
+    recs = _records(_run(tmp_path, "signed.jsonl", "--sign"))
+
+    assert [r["idx"] for r in recs] == list(range(12))
+    ok, bad_idx, reason = verify_chain(recs)
+    assert ok, (bad_idx, reason)
+    for r in recs:
+        chain = r["chain"]
+        payload = {k: v for k, v in r.items() if k != "chain"}
+        assert verify_bytes(
+            canonical_json_bytes(payload), chain["signature_hex"], chain.get("public_key_hex"), chain["scheme"]
+        )
+
+
+def test_spike_spanning_draw_blocks(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """A spike crossing a _DRAW_BLOCK boundary is applied to every minute in its window, once."""
+    monkeypatch.setattr(sim, "_DRAW_BLOCK", 4)
+    plain = _records(_run(tmp_path, "plain.jsonl"))
+    spiked = _records(_run(tmp_path, "spiked.jsonl", "--audio-spike", "t=2,dur=5,delta=10"))
+
+    deltas = [round(s["audio"]["laeq_db"] - p["audio"]["laeq_db"]) for p, s in zip(plain, spiked)]
+    assert deltas == [0, 0, 10, 10, 10, 10, 10, 0, 0, 0, 0, 0]
+
+
+def test_compact_header_and_band_arrays(tmp_path: Path):
+    """--compact: an unchained header with the centers, then band arrays in that order."""
+    keyed = _records(_run(tmp_path, "keyed.jsonl"))
+    compact = _records(_run(tmp_path, "compact.jsonl", "--compact"))
+
+    header, minutes = compact[0], compact[1:]
+    assert header["type"] == "header" and "chain" not in header
+    assert len(minutes) == len(keyed)
+    centers = [str(c) for c in header["centers"]]
+    for k, c in zip(keyed, minutes):
+        bands = k["audio"]["third_octave_db"]
+        assert sorted(centers) == sorted(bands)
+        assert c["audio"]["third_octave_db"] == [bands[key] for key in centers]
+    ok, bad_idx, reason = verify_chain(minutes)
+    assert ok, (bad_idx, reason)
+
+
+def test_gzip_output_round_trips(tmp_path: Path):
+    """A .gz outfile is gzip-compressed (picked from the suffix) and holds the same lines."""
+    plain = _run(tmp_path, "m.jsonl")
+    gz = _run(tmp_path, "m.jsonl.gz")
+    assert gz.read_bytes()[:2] == b"\x1f\x8b"
+    assert gzip.decompress(gz.read_bytes()) == plain.read_bytes()
+
+
+def test_zstd_without_zstandard_is_bad_args(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(sim, "_HAVE_ZSTD", False)
+    out = tmp_path / "m.jsonl.zst"
+    assert sim.main([*BASE_ARGS, "--minutes", "2", "--outfile", str(out)]) == sim.EXIT_BAD_ARGS
+    assert not out.exists()
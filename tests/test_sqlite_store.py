@@ -0,0 +1,44 @@
+# tests/test_sqlite_store.py
+from __future__ import annotations
+
+from avsafe_descriptors.integrity.hash_chain import make_record
+from avsafe_descriptors.io import sqlite_store
+from avsafe_descriptors.io.jsonl_io import loads_line
+from avsafe_descriptors.report.render_html import _verify_chain_and_signatures
+
+
+def _chained_minutes(n: int) -> list[dict]:
+    out, prev = [], None
+    for i in range(n):
+        payload = {
+            "idx": i,
+            "ts": f"2024-01-01T00:{i:02d}:00Z",
+            "audio": {
+                "laeq_db": 55.123456789012345 + i,
+                "lcpeak_db": 80.1,
+                "third_octave_db": {"1000": 41.0000000000001},
+            },
+            "light": {
+                "tlm_freq_hz": 100.0,
+                "tlm_mod_percent": 3.3333333333333335,
+                "flicker_index": 0.006049685055722206,
+            },
+        }
+        rec = make_record(payload, prev)
+        prev = rec["chain"]["hash"]
+        out.append(rec)
+    return out
+
+
+def test_dump_minutes_jsonl_keeps_chain_verifiable(tmp_path):
+    db = tmp_path / "m.db"
+    sqlite_store.ensure_schema(db)
+    assert sqlite_store.ingest(db, "s", _chained_minutes(5)) == 5
+
+    out = tmp_path / "minutes.jsonl"
+    assert sqlite_store.dump_minutes_jsonl(db, "s", out) == 5
+
+    minutes = [loads_line(line) for line in out.read_text(encoding="utf-8").splitlines()]
+    assert minutes[0]["light"]["flicker_index"] == 0.006049685055722206
+    res = _verify_chain_and_signatures(minutes)
+    assert res["chain"]["ok"], res["chain"]["break_indices"]
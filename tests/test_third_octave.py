@@ -0,0 +1,48 @@
+# tests/test_third_octave.py
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from avsafe_descriptors.audio.third_octave import (
+    bin_narrowband_levels_to_third_octave,
+    center_from_index,
+    nominal_center_label,
+    nominal_center_label_from_k,
+    third_octave_band_edges,
+)
+
+
+def test_single_tone_lands_in_its_band():
+    out = bin_narrowband_levels_to_third_octave([1000.0], [60.0], 100.0, 5000.0)
+    assert out[1000] == pytest.approx(60.0, abs=1e-9)
+    assert all(v == float("-inf") for k, v in out.items() if k != 1000)
+
+
+def test_upper_edge_belongs_to_lower_band():
+    """Bands are (lo, hi]: a tone exactly on the upper edge stays in that band."""
+    _, fhi = third_octave_band_edges(1000.0)
+    out = bin_narrowband_levels_to_third_octave([fhi], [50.0], 100.0, 5000.0)
+    assert out[1000] == pytest.approx(50.0, abs=1e-9)
+
+
+def test_energy_sum_within_band():
+    out = bin_narrowband_levels_to_third_octave([990.0, 1010.0], [60.0, 60.0], 100.0, 5000.0)
+    assert out[1000] == pytest.approx(60.0 + 10.0 * math.log10(2.0), abs=1e-9)
+
+
+def test_out_of_range_and_nonpositive_are_ignored():
+    out = bin_narrowband_levels_to_third_octave([-5.0, 0.0, 50.0, 90_000.0], [80.0] * 4, 100.0, 5000.0)
+    assert all(v == float("-inf") for v in out.values())
+
+
+def test_length_mismatch_raises():
+    with pytest.raises(ValueError):
+        bin_narrowband_levels_to_third_octave([100.0, 200.0], [60.0])
+
+
+@pytest.mark.parametrize("fref", [1000.0, 997.0])
+def test_label_from_k_matches_label_from_center(fref):
+    for k in range(-35, 55):
+        assert nominal_center_label_from_k(k, fref) == nominal_center_label(center_from_index(k, fref))
@@ -19,3 +19,17 @@ def test_minute_aggregate_shape():
         agg.add(w)
     s = agg.summary()
     assert set(s.keys()) == {"f_flicker_Hz", "pct_mod_p95", "flicker_index_p95"}
+
+def test_aggregator_reset_matches_fresh():
+    fs = 2000.0
+    t = np.arange(0, 3.0, 1/fs)
+    x = 1.0 + 0.1 * np.sin(2*np.pi*100.0*t)
+    reused = MinuteAggregator()
+    for w in window_metrics(np.full(t.size, 2.0), fs, mains_hint=50.0):
+        reused.add(w)
+    reused.reset()
+    fresh = MinuteAggregator()
+    for w in window_metrics(x, fs, mains_hint=50.0):
+        reused.add(w)
+        fresh.add(w)
+    assert reused.summary() == fresh.summary()